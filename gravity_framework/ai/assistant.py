@@ -25,7 +25,7 @@ import requests
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 
-from gravity_framework.models.service import Service
+from gravity_framework.models.service import Service, DatabaseType
 from gravity_framework.ai.installer import ensure_ollama
 
 logger = logging.getLogger(__name__)
@@ -230,9 +230,8 @@ class AIAssistant:
         
         # Cache recommendations
         has_redis = any(
-            db.type.value == "redis" 
-            for service in services 
-            for db in service.manifest.databases
+            DatabaseType.REDIS in service.manifest.db_types
+            for service in services
         )
         if not has_redis and len(services) > 3:
             analysis["recommendations"].append({
@@ -432,9 +431,8 @@ class AIAssistant:
         
         # Performance optimizations
         has_cache = any(
-            db.type.value == "redis"
+            DatabaseType.REDIS in service.manifest.db_types
             for service in services
-            for db in service.manifest.databases
         )
         
         if not has_cache:
@@ -21,6 +21,7 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 from typing import Optional, Dict, List, Any
 import logging
 import asyncio
+from collections import defaultdict
 from pathlib import Path
 
 from gravity_framework.models.service import Service, ServiceRegistry, ServiceStatus
@@ -89,6 +90,10 @@ class GravityFramework:
         self.scanner = ServiceScanner(self.project_path / "services")
         self.db_orchestrator = DatabaseOrchestrator(self.config.get("databases", {}))
         self.service_manager = ServiceManager()
+        # Per-service locks: concurrent install() calls of one service take
+        # turns and the later one skips it once installed, while independent
+        # services still install in parallel.
+        self._install_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self.ai = AIAssistant(
             enabled=ai_assist,
             ollama_model=ollama_model,
@@ -252,17 +257,24 @@ class GravityFramework:
             
             # Install services in dependency order
             for service in ordered_services:
-                logger.info(f"📦 Installing {service.manifest.name}...")
-                
-                # Setup databases
-                if not await self.db_orchestrator.setup_databases(service):
-                    logger.error(f"Failed to setup databases for {service.manifest.name}")
-                    return False
-                
-                # Install service
-                if not await self.service_manager.install_service(service):
-                    logger.error(f"Failed to install {service.manifest.name}")
-                    return False
+                async with self._install_locks[service.manifest.name]:
+                    # A concurrent install() may have finished this service
+                    # while we waited for the lock
+                    if service.status == ServiceStatus.INSTALLED:
+                        logger.info(f"✓ {service.manifest.name} already installed")
+                        continue
+                    
+                    logger.info(f"📦 Installing {service.manifest.name}...")
+                    
+                    # Setup databases
+                    if not await self.db_orchestrator.setup_databases(service):
+                        logger.error(f"Failed to setup databases for {service.manifest.name}")
+                        return False
+                    
+                    # Install service
+                    if not await self.service_manager.install_service(service):
+                        logger.error(f"Failed to install {service.manifest.name}")
+                        return False
             
             logger.info(f"✓ Successfully installed {len(ordered_services)} service(s)")
             return True
@@ -311,11 +323,11 @@ class GravityFramework:
                 env_vars = {}
                 
                 # Add database connection strings
+                db_env_keys = service.manifest.db_env_keys
                 for db_req in service.manifest.databases:
                     if db_req.name in service.created_databases:
                         conn_str = await self.db_orchestrator.get_connection_string(db_req)
-                        env_key = f"{db_req.name.upper()}_URL"
-                        env_vars[env_key] = conn_str
+                        env_vars[db_env_keys[db_req.name]] = conn_str
                 
                 # Start service
                 logger.info(f"🚀 Starting {service.manifest.name}...")
@@ -470,6 +482,14 @@ class GravityFramework:
                 health_status[service.manifest.name] = is_healthy
             return health_status
     
+    async def aclose(self) -> None:
+        """
+        Release resources held by the framework.
+        
+        Closes the HTTP client shared by service health checks.
+        """
+        await self.service_manager.aclose()
+    
     def register_plugin(self, name: str, plugin: Any) -> None:
         """
         Register a custom plugin for extensibility.
@@ -17,12 +17,16 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-import docker
-from docker.models.containers import Container
-from typing import Dict, Optional, List
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, List, Set
+from pathlib import Path
+import subprocess
+import asyncio
 import logging
 
-from gravity_framework.models.service import Service
+from gravity_framework.models.service import Service, ServiceStatus
+
+if TYPE_CHECKING:
+    from docker.models.containers import Container
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +34,54 @@ logger = logging.getLogger(__name__)
 class ServiceManager:
     """Manages service lifecycle and operations."""
     
-    def __init__(self, docker_client=None):
+    def __init__(self, docker_client=None, http_client=None, runner=None, http_transport=None):
         """Initialize service manager.
         
         Args:
             docker_client: Optional Docker client instance. If None, will be created on first use.
+            http_client: Optional httpx.AsyncClient for health checks. If None, will be created on first use.
+            runner: Optional async callable ``(cmd, cwd, timeout) -> CompletedProcess``
+                    used to run install commands. Defaults to ``_run_command``.
+            http_transport: Optional httpx transport for the lazily created health-check
+                            client (e.g. ``httpx.MockTransport`` in tests).
         """
         self._docker_client = docker_client
-        self.containers: Dict[str, Container] = {}
+        self._http_client = http_client
+        self._http_transport = http_transport
+        # Host ports handed out by _reserve_ports and not yet released
+        self._reserved_ports: Set[int] = set()
+        self._runner = runner or self._run_command
+        self.containers: Dict[str, "Container"] = {}
     
     @property
     def docker_client(self):
-        """Lazy-load Docker client."""
+        """Lazy-load Docker client (the docker SDK is imported on first use)."""
         if self._docker_client is None:
+            import docker
             self._docker_client = docker.from_env()
         return self._docker_client
     
+    @property
+    def http_client(self):
+        """Lazy-load the HTTP client shared by all health checks.
+        
+        Reusing one client keeps connections alive between checks instead of
+        paying connection and pool setup on every request.
+        """
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=64),
+                transport=self._http_transport
+            )
+        return self._http_client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def install_service(self, service: Service) -> bool:
         """Install a service (run install script if exists).
         
@@ -73,11 +109,9 @@ class ServiceManager:
                 if script_path.exists():
                     logger.info(f"Running install script: {service.manifest.install_script}")
                     
-                    result = subprocess.run(
+                    result = await self._runner(
                         ["/bin/bash", str(script_path)],
                         cwd=service_path,
-                        capture_output=True,
-                        text=True,
                         timeout=300  # 5 minutes timeout
                     )
                     
@@ -94,11 +128,9 @@ class ServiceManager:
             if requirements_file.exists():
                 logger.info("Installing Python dependencies...")
                 
-                result = subprocess.run(
+                result = await self._runner(
                     ["pip", "install", "-r", "requirements.txt"],
                     cwd=service_path,
-                    capture_output=True,
-                    text=True,
                     timeout=600  # 10 minutes timeout
                 )
                 
@@ -110,11 +142,9 @@ class ServiceManager:
             if package_json.exists():
                 logger.info("Installing Node.js dependencies...")
                 
-                result = subprocess.run(
+                result = await self._runner(
                     ["npm", "install"],
                     cwd=service_path,
-                    capture_output=True,
-                    text=True,
                     timeout=600
                 )
                 
@@ -136,6 +166,41 @@ class ServiceManager:
             service.error_message = str(e)
             return False
     
+    async def _run_command(self, cmd: List[str], cwd: Path, timeout: int) -> subprocess.CompletedProcess:
+        """Run a command without blocking the event loop.
+        
+        Args:
+            cmd: Command and arguments
+            cwd: Working directory
+            timeout: Timeout in seconds
+            
+        Returns:
+            Completed process with decoded stdout and stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+    
     async def start_service(self, service: Service, env_vars: Optional[Dict[str, str]] = None) -> bool:
         """Start a service in Docker container.
         
@@ -146,6 +211,8 @@ class ServiceManager:
         Returns:
             True if service started successfully
         """
+        from docker.errors import ContainerError, ImageNotFound
+        
         logger.info(f"Starting service: {service.manifest.name}")
         
         if not service.path:
@@ -153,6 +220,7 @@ class ServiceManager:
             return False
         
         service.status = ServiceStatus.STARTING
+        reserved: List[int] = []
         
         try:
             # Prepare environment variables
@@ -161,17 +229,21 @@ class ServiceManager:
                 environment.update(env_vars)
             
             # Add database connection strings
+            db_env_keys = service.manifest.db_env_keys
             for db in service.created_databases:
-                db_req = next((d for d in service.manifest.databases if d.name == db), None)
-                if db_req:
-                    env_key = f"{db.upper()}_URL"
+                env_key = db_env_keys.get(db)
+                if env_key:
                     # This will be set by database orchestrator
                     environment.setdefault(env_key, "")
             
             # Prepare port mappings
             ports = {}
+            reserved = self._reserve_ports(
+                sum(1 for port_config in service.manifest.ports if not port_config.host)
+            )
+            free_ports = list(reserved)
             for port_config in service.manifest.ports:
-                host_port = port_config.host or self._find_free_port()
+                host_port = port_config.host or free_ports.pop()
                 container_port = port_config.container
                 ports[f"{container_port}/{port_config.protocol}"] = host_port
                 service.assigned_ports[container_port] = host_port
@@ -239,12 +311,12 @@ class ServiceManager:
             logger.info(f"✓ Service started: {service.manifest.name} (container: {container.short_id})")
             return True
             
-        except docker.errors.ContainerError as e:
+        except ContainerError as e:
             logger.error(f"Container error for {service.manifest.name}: {e}")
             service.status = ServiceStatus.ERROR
             service.error_message = str(e)
             return False
-        except docker.errors.ImageNotFound as e:
+        except ImageNotFound as e:
             logger.error(f"Image not found for {service.manifest.name}: {e}")
             service.status = ServiceStatus.ERROR
             service.error_message = f"Image not found: {service.manifest.runtime}"
@@ -254,6 +326,10 @@ class ServiceManager:
             service.status = ServiceStatus.ERROR
             service.error_message = str(e)
             return False
+        finally:
+            # A failed start hands its auto-assigned ports back
+            if service.status != ServiceStatus.RUNNING:
+                self._release_ports(reserved)
     
     async def stop_service(self, service: Service, timeout: int = 10) -> bool:
         """Stop a running service.
@@ -265,6 +341,8 @@ class ServiceManager:
         Returns:
             True if service stopped successfully
         """
+        from docker.errors import NotFound
+        
         logger.info(f"Stopping service: {service.manifest.name}")
         
         if not service.container_id:
@@ -281,7 +359,7 @@ class ServiceManager:
             logger.info(f"✓ Service stopped: {service.manifest.name}")
             return True
             
-        except docker.errors.NotFound:
+        except NotFound:
             logger.warning(f"Container not found: {service.container_id}")
             service.status = ServiceStatus.STOPPED
             return True
@@ -290,6 +368,8 @@ class ServiceManager:
             service.status = ServiceStatus.ERROR
             service.error_message = str(e)
             return False
+        finally:
+            self._release_ports(service.assigned_ports.values())
     
     async def restart_service(self, service: Service) -> bool:
         """Restart a service.
@@ -361,21 +441,34 @@ class ServiceManager:
         url = f"http://localhost:{http_port}{service.manifest.health_check.endpoint}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    timeout=service.manifest.health_check.timeout
-                )
-                return response.status_code == 200
+            response = await self.http_client.get(
+                url,
+                timeout=service.manifest.health_check.timeout
+            )
+            return response.status_code == 200
         except Exception:
             return False
     
-    async def _wait_for_health(self, service: Service, max_attempts: Optional[int] = None) -> bool:
+    async def _wait_for_health(
+        self,
+        service: Service,
+        max_attempts: Optional[int] = None,
+        base_delay: float = 1.0,
+        max_delay: Optional[float] = None
+    ) -> bool:
         """Wait for service to become healthy.
         
+        Checks the service at most ``max_attempts`` times. Retries back off
+        exponentially from ``base_delay``, each delay capped at ``max_delay``,
+        and the last retry waits out the rest of ``(attempts - 1) * max_delay``.
+        Quick services are seen sooner while slow-starting ones keep the same
+        total wait as fixed-interval polling.
+        
         Args:
             service: Service instance
-            max_attempts: Maximum number of attempts (uses health_check.retries if None)
+            max_attempts: Maximum number of checks (uses health_check.retries if None)
+            base_delay: Delay in seconds before the first retry (0 retries at once)
+            max_delay: Longest single delay (uses health_check.interval if None)
             
         Returns:
             True if service became healthy
@@ -384,26 +477,87 @@ class ServiceManager:
             return True
         
         attempts = max_attempts or service.manifest.health_check.retries
-        interval = service.manifest.health_check.interval
+        if max_delay is None:
+            max_delay = service.manifest.health_check.interval
+        budget = (attempts - 1) * max_delay
         
+        waited = 0.0
         for i in range(attempts):
             if await self.check_health(service):
                 return True
             
-            if i < attempts - 1:
-                await asyncio.sleep(interval)
+            if i == attempts - 1:
+                break
+            
+            if i == attempts - 2:
+                step = budget - waited
+            else:
+                step = min(base_delay * 2 ** i, max_delay)
+            await asyncio.sleep(step)
+            waited += step
         
         return False
     
     def _find_free_port(self) -> int:
         """Find a free port on the host.
         
+        The port is not reserved; use ``_reserve_ports`` to hold it.
+        
         Returns:
             Free port number
         """
+        return self._probe_free_ports(1)[0]
+    
+    def _reserve_ports(self, count: int) -> List[int]:
+        """Reserve distinct free host ports in one batch.
+        
+        Reserved ports are skipped by later reservations until released with
+        ``_release_ports``.
+        
+        Args:
+            count: Number of ports to reserve
+            
+        Returns:
+            List of free port numbers
+        """
+        ports = self._probe_free_ports(count)
+        self._reserved_ports.update(ports)
+        return ports
+    
+    def _release_ports(self, ports: Iterable[int]) -> None:
+        """Release host ports handed out by ``_reserve_ports``.
+        
+        Args:
+            ports: Port numbers to release (unknown ports are ignored)
+        """
+        self._reserved_ports.difference_update(ports)
+    
+    def _probe_free_ports(self, count: int) -> List[int]:
+        """Find distinct free host ports that are not currently reserved.
+        
+        All sockets are held open together so the kernel hands out distinct
+        ports, and ports reserved earlier (but not yet released) are skipped.
+        
+        Args:
+            count: Number of ports to find
+            
+        Returns:
+            List of free port numbers
+        """
         import socket
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind(('', 0))
-            s.listen(1)
-            port = s.getsockname()[1]
-        return port
+        
+        ports: List[int] = []
+        sockets = []
+        try:
+            while len(ports) < count:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sockets.append(s)
+                s.bind(('', 0))
+                port = s.getsockname()[1]
+                if port not in self._reserved_ports:
+                    ports.append(port)
+        finally:
+            for s in sockets:
+                s.close()
+        
+        return ports
@@ -22,8 +22,6 @@ from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import logging
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import text, inspect
 import asyncio
 from contextlib import asynccontextmanager
 
@@ -51,6 +49,10 @@ class DatabaseConnection:
         self.database_url = database_url
         self.database_type = database_type
         
+        # sqlalchemy is imported here rather than at module level so that
+        # importing the framework does not pay for it until a connection is made
+        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+        
         # Create async engine
         self.engine = create_async_engine(
             database_url,
@@ -83,6 +85,8 @@ class DatabaseConnection:
     
     async def get_tables(self) -> List[str]:
         """Get list of all tables in database."""
+        from sqlalchemy import text
+        
         if self._table_cache is not None:
             return self._table_cache
         
@@ -119,6 +123,8 @@ class DatabaseConnection:
         Returns:
             Schema information including columns and types
         """
+        from sqlalchemy import text
+        
         async with self.session() as session:
             if self.database_type == "postgresql":
                 query = text("""
@@ -175,6 +181,8 @@ class DatabaseConnection:
         Returns:
             List of result rows as dictionaries
         """
+        from sqlalchemy import text
+        
         async with self.session() as session:
             result = await session.execute(text(sql), params or {})
             
@@ -257,6 +265,8 @@ class MultiDatabaseAccessManager:
         Returns:
             True if successful
         """
+        from sqlalchemy import text
+        
         try:
             connection = DatabaseConnection(service_name, database_url, database_type)
             
@@ -17,11 +17,13 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-from typing import Dict, List, Optional, Any
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 import logging
 
-from gravity_framework.models.service import Service, DatabaseRequirement
+from gravity_framework.models.service import Service, DatabaseRequirement, DatabaseType
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ class DatabaseOrchestrator:
             config: Database configuration
         """
         self.config = config or {}
-        self.engines: Dict[str, AsyncEngine] = {}
+        self.engines: Dict[str, "AsyncEngine"] = {}
         self.connections: Dict[str, any] = {}
         
         # Default configurations
@@ -101,6 +103,8 @@ class DatabaseOrchestrator:
         Args:
             db_req: Database requirement
         """
+        import asyncpg
+        
         # Connect to postgres database
         conn = await asyncpg.connect(
             host=self.postgres_host,
@@ -150,6 +154,8 @@ class DatabaseOrchestrator:
         Args:
             db_req: Database requirement
         """
+        import aiomysql
+        
         # Connect to MySQL
         conn = await aiomysql.connect(
             host=self.mysql_host,
@@ -190,6 +196,8 @@ class DatabaseOrchestrator:
         Args:
             db_req: Database requirement
         """
+        from motor.motor_asyncio import AsyncIOMotorClient
+        
         # MongoDB creates databases automatically when data is written
         # We just verify connection and create a dummy collection
         
@@ -221,6 +229,8 @@ class DatabaseOrchestrator:
         Args:
             db_req: Database requirement
         """
+        import redis.asyncio as aioredis
+        
         # Redis doesn't have databases in the traditional sense
         # We just verify connection
         
@@ -313,6 +323,8 @@ class DatabaseOrchestrator:
     
     async def _drop_postgres_db(self, db_name: str) -> None:
         """Drop PostgreSQL database."""
+        import asyncpg
+        
         conn = await asyncpg.connect(
             host=self.postgres_host,
             port=self.postgres_port,
@@ -328,6 +340,8 @@ class DatabaseOrchestrator:
     
     async def _drop_mysql_db(self, db_name: str) -> None:
         """Drop MySQL database."""
+        import aiomysql
+        
         conn = await aiomysql.connect(
             host=self.mysql_host,
             port=self.mysql_port,
@@ -344,6 +358,8 @@ class DatabaseOrchestrator:
     
     async def _drop_mongodb(self, db_name: str) -> None:
         """Drop MongoDB database."""
+        from motor.motor_asyncio import AsyncIOMotorClient
+        
         if self.mongodb_user and self.mongodb_password:
             uri = f"mongodb://{self.mongodb_user}:{self.mongodb_password}@{self.mongodb_host}:{self.mongodb_port}"
         else:
@@ -24,7 +24,7 @@ from pathlib import Path
 from typing import Optional, List, Dict
 import git
 import yaml
-from jsonschema import validate, ValidationError
+from jsonschema import Draft202012Validator, ValidationError
 
 from gravity_framework.models.service import Service, ServiceManifest, ServiceStatus
 
@@ -43,6 +43,21 @@ MANIFEST_SCHEMA = {
     }
 }
 
+# Compile the schema once instead of re-checking it on every manifest
+Draft202012Validator.check_schema(MANIFEST_SCHEMA)
+_MANIFEST_VALIDATOR = Draft202012Validator(MANIFEST_SCHEMA)
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Manifest file names, in lookup priority order
+MANIFEST_FILENAMES = (
+    "gravity-service.yaml",
+    "gravity-service.yml",
+    ".gravity-service.yaml",
+    ".gravity.yaml",
+)
+
 
 class ServiceScanner:
     """
@@ -139,18 +154,11 @@ class ServiceScanner:
                         branch=branch
                     )
             
-            # Look for manifest file
-            manifest_path = service_path / "gravity-service.yaml"
-            if not manifest_path.exists():
-                # Try alternative names
-                for alt_name in ["gravity-service.yml", ".gravity-service.yaml", ".gravity.yaml"]:
-                    alt_path = service_path / alt_name
-                    if alt_path.exists():
-                        manifest_path = alt_path
-                        break
-                else:
-                    logger.warning(f"No gravity-service.yaml found in {repo_name}")
-                    return None
+            # Look for manifest file (primary or alternative names)
+            manifest_path = self._find_manifest(service_path)
+            if not manifest_path:
+                logger.warning(f"No gravity-service.yaml found in {repo_name}")
+                return None
             
             # Parse manifest
             manifest = self._parse_manifest(manifest_path, repo_url, branch)
@@ -236,8 +244,8 @@ class ServiceScanner:
         """
         logger.info(f"Discovering service from {path}")
         
-        manifest_path = path / "gravity-service.yaml"
-        if not manifest_path.exists():
+        manifest_path = self._find_manifest(path, MANIFEST_FILENAMES[:1])
+        if not manifest_path:
             logger.warning(f"No gravity-service.yaml found in {path}")
             return None
         
@@ -254,6 +262,42 @@ class ServiceScanner:
         logger.info(f"✓ Discovered service: {manifest.name} v{manifest.version}")
         return service
     
+    def _find_manifest(self, directory: Path, names: tuple = MANIFEST_FILENAMES) -> Optional[Path]:
+        """Find the manifest file in a service directory.
+        
+        Lists the directory once with os.scandir instead of probing each
+        candidate name with a separate stat call; a single accepted name is
+        checked directly since one stat is cheaper than a listing.
+        
+        Args:
+            directory: Service directory
+            names: Accepted manifest file names, in priority order
+            
+        Returns:
+            Path to the manifest or None if not found
+        """
+        if len(names) == 1:
+            candidate = directory / names[0]
+            return candidate if candidate.is_file() else None
+        
+        try:
+            with os.scandir(directory) as entries:
+                # is_file() follows symlinks like the Path checks it replaced,
+                # so a manifest linked in from elsewhere is still found
+                found = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name in names and entry.is_file()
+                }
+        except OSError:
+            return None
+        
+        for name in names:
+            if name in found:
+                return Path(found[name])
+        
+        return None
+    
     def discover_all(self) -> List[Service]:
         """Discover all services in services directory.
         
@@ -263,13 +307,17 @@ class ServiceScanner:
         logger.info(f"Scanning for services in {self.services_dir}")
         services = []
         
-        for service_dir in self.services_dir.iterdir():
-            if not service_dir.is_dir() or service_dir.name.startswith("."):
-                continue
-            
-            service = self.discover_from_path(service_dir)
-            if service:
-                services.append(service)
+        # scandir reports entry types from the directory listing, so hidden
+        # entries (.git, .venv, ...) are skipped without ever being stat'd;
+        # only symlinks (e.g. a linked local checkout) are followed with a stat
+        with os.scandir(self.services_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                
+                service = self.discover_from_path(Path(entry.path))
+                if service:
+                    services.append(service)
         
         logger.info(f"✓ Discovered {len(services)} service(s)")
         return services
@@ -286,15 +334,40 @@ class ServiceScanner:
             Parsed manifest or None if invalid
         """
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            text = manifest_path.read_text(encoding="utf-8")
+        except Exception as e:
+            logger.error(f"Error parsing manifest {manifest_path}: {e}")
+            return None
+        
+        return self._parse_manifest_text(text, repo, branch, source=str(manifest_path))
+    
+    def _parse_manifest_text(
+        self,
+        text: str,
+        repo: str,
+        branch: str,
+        source: str = "<string>"
+    ) -> Optional[ServiceManifest]:
+        """Parse service manifest YAML text.
+        
+        Args:
+            text: Manifest YAML content
+            repo: Repository URL or path
+            branch: Branch name
+            source: Where the text came from, for log messages
+            
+        Returns:
+            Parsed manifest or None if invalid
+        """
+        try:
+            data = yaml.load(text, Loader=_YAML_LOADER)
             
             if not data:
-                logger.error(f"Empty manifest file: {manifest_path}")
+                logger.error(f"Empty manifest file: {source}")
                 return None
             
             # Validate against JSON schema
-            validate(instance=data, schema=MANIFEST_SCHEMA)
+            _MANIFEST_VALIDATOR.validate(data)
             
             # Ensure repository and branch are set
             data.setdefault("repository", repo)
@@ -307,11 +380,11 @@ class ServiceScanner:
             return manifest
             
         except yaml.YAMLError as e:
-            logger.error(f"YAML parsing error in {manifest_path}: {e}")
+            logger.error(f"YAML parsing error in {source}: {e}")
             return None
         except ValidationError as e:
-            logger.error(f"Manifest validation error in {manifest_path}: {e.message}")
+            logger.error(f"Manifest validation error in {source}: {e.message}")
             return None
         except Exception as e:
-            logger.error(f"Error parsing manifest {manifest_path}: {e}")
+            logger.error(f"Error parsing manifest {source}: {e}")
             return None
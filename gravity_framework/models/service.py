@@ -17,8 +17,9 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, FrozenSet
 from enum import Enum
+import sys
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from datetime import datetime
 
@@ -56,6 +57,8 @@ class ServiceStatus(str, Enum):
 
 class DatabaseRequirement(BaseModel):
     """Database requirement model."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Database name")
     type: DatabaseType = Field(..., description="Database type")
     version: Optional[str] = Field(None, description="Required version")
@@ -81,6 +84,8 @@ class HealthCheck(BaseModel):
 
 class ServicePort(BaseModel):
     """Service port configuration."""
+    model_config = ConfigDict(frozen=True)
+    
     container: int = Field(..., description="Container port")
     host: Optional[int] = Field(None, description="Host port (auto-assigned if not specified)")
     protocol: str = Field("tcp", description="Protocol (tcp/udp)")
@@ -141,7 +146,8 @@ class ServiceManifest(BaseModel):
         """Validate service name."""
         if not v.replace("-", "").replace("_", "").isalnum():
             raise ValueError("Service name must contain only alphanumeric characters, hyphens, and underscores")
-        return v.lower()
+        # Interned: names are the keys of every registry/resolver lookup
+        return sys.intern(v.lower())
     
     @field_validator("version")
     @classmethod
@@ -151,6 +157,20 @@ class ServiceManifest(BaseModel):
         if len(parts) < 2:
             raise ValueError("Version must be in format X.Y or X.Y.Z")
         return v
+    
+    @property
+    def db_types(self) -> FrozenSet[DatabaseType]:
+        """Database types required by this service, derived from ``databases`` on each access."""
+        return frozenset(db.type for db in self.databases)
+    
+    @property
+    def db_env_keys(self) -> Dict[str, str]:
+        """Connection-string environment variable name per database (e.g. MAIN_DB_URL).
+
+        Derived from ``databases`` on each access rather than cached, so it
+        always reflects the current list.
+        """
+        return {db.name: f"{db.name.upper()}_URL" for db in self.databases}
 
 
 class Service(BaseModel):
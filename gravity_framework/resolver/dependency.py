@@ -18,8 +18,11 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 """
 
 from typing import Dict, List, Set, Optional, Tuple
+from collections import defaultdict, deque
 from dataclasses import dataclass
 import logging
+import re
+import sys
 
 from gravity_framework.models.service import Service, ServiceManifest
 
@@ -127,7 +130,7 @@ class DependencyResolver:
             service_name = service.manifest.name
             
             for dep in service.manifest.dependencies:
-                dep_name = dep.name
+                dep_name = sys.intern(dep.name)
                 
                 # Check if dependency exists
                 if dep_name not in self.services:
@@ -0,0 +1,250 @@
+"""
+================================================================================
+PROJECT: Gravity Framework
+FILE: tests/_fakes.py
+PURPOSE: Test doubles
+DESCRIPTION: Lightweight fakes for Docker objects, database drivers, git
+             repositories and subprocess.run used across the test suite.
+
+AUTHOR: Gravity Framework Team
+EMAIL: team@gravityframework.dev
+LICENSE: MIT
+CREATED: 2025-11-13
+MODIFIED: 2025-11-14
+
+COPYRIGHT: (c) 2025 Gravity Framework Team
+REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
+================================================================================
+"""
+
+import subprocess
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class FakeContainer:
+    """Stand-in for a docker Container that records what the manager did to it.
+    
+    Set ``error`` to make ``stop`` and ``logs`` raise.
+    """
+    id: str = "container-id"
+    status: str = "running"
+    log_output: bytes = b""
+    error: Optional[Exception] = None
+    stopped: bool = False
+    stop_timeout: Optional[int] = None
+    removed: bool = False
+    logs_kwargs: Optional[Dict[str, Any]] = None
+    
+    @property
+    def short_id(self) -> str:
+        """Short container ID, as shown by docker ps."""
+        return self.id[:12]
+    
+    def stop(self, timeout: Optional[int] = None) -> None:
+        """Record a stop call."""
+        if self.error:
+            raise self.error
+        self.stopped = True
+        self.stop_timeout = timeout
+    
+    def remove(self, **kwargs) -> None:
+        """Record a remove call."""
+        self.removed = True
+    
+    def logs(self, **kwargs) -> bytes:
+        """Record the log options and return the canned output."""
+        if self.error:
+            raise self.error
+        self.logs_kwargs = kwargs
+        return self.log_output
+
+
+@dataclass(slots=True)
+class StubPGConn:
+    """Stand-in for an asyncpg connection that records executed statements."""
+    exists: bool = False
+    executed: List[str] = field(default_factory=list)
+    closed: bool = False
+    
+    async def fetchval(self, query: str, *args) -> Optional[int]:
+        """Answer the pg_database existence check."""
+        return 1 if self.exists else None
+    
+    async def execute(self, query: str, *args) -> None:
+        """Record a statement."""
+        self.executed.append(query)
+    
+    async def close(self) -> None:
+        """Record the close call."""
+        self.closed = True
+
+
+@dataclass(slots=True)
+class StubMySQLCursor:
+    """Stand-in for an aiomysql cursor, usable as ``async with conn.cursor()``."""
+    row: Optional[Tuple] = None
+    executed: List[str] = field(default_factory=list)
+    
+    async def __aenter__(self) -> "StubMySQLCursor":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+    
+    async def execute(self, query: str, args: Any = None) -> None:
+        """Record a statement."""
+        self.executed.append(query)
+    
+    async def fetchone(self) -> Optional[Tuple]:
+        """Return the canned row (``None`` means the schema does not exist)."""
+        return self.row
+
+
+@dataclass(slots=True)
+class StubMySQLConn:
+    """Stand-in for an aiomysql connection handing out a single cursor."""
+    cursor_stub: StubMySQLCursor = field(default_factory=StubMySQLCursor)
+    committed: bool = False
+    closed: bool = False
+    
+    def cursor(self) -> StubMySQLCursor:
+        """Return the shared cursor."""
+        return self.cursor_stub
+    
+    async def commit(self) -> None:
+        """Record the commit."""
+        self.committed = True
+    
+    def close(self) -> None:
+        """Record the close call (synchronous in aiomysql)."""
+        self.closed = True
+
+
+@dataclass(slots=True)
+class StubMongoDB:
+    """Stand-in for a motor database that records collections and commands."""
+    collections: List[str] = field(default_factory=list)
+    commands: List[str] = field(default_factory=list)
+    
+    async def create_collection(self, name: str) -> None:
+        """Record a created collection."""
+        self.collections.append(name)
+    
+    async def command(self, name: str) -> Dict[str, Any]:
+        """Record a database command."""
+        self.commands.append(name)
+        return {"ok": 1}
+
+
+@dataclass(slots=True)
+class StubMongoClient:
+    """Stand-in for AsyncIOMotorClient; ``client[name]`` yields a StubMongoDB."""
+    databases: Dict[str, StubMongoDB] = field(default_factory=dict)
+    dropped: List[str] = field(default_factory=list)
+    closed: bool = False
+    
+    def __getitem__(self, name: str) -> StubMongoDB:
+        return self.databases.setdefault(name, StubMongoDB())
+    
+    async def drop_database(self, name: str) -> None:
+        """Record a dropped database."""
+        self.dropped.append(name)
+    
+    def close(self) -> None:
+        """Record the close call."""
+        self.closed = True
+
+
+@dataclass(slots=True)
+class StubRedis:
+    """Stand-in for a redis.asyncio client.
+    
+    Awaitable like the real client, so ``await aioredis.from_url(...)`` yields it.
+    """
+    pinged: bool = False
+    closed: bool = False
+    
+    def __await__(self):
+        return self._ready().__await__()
+    
+    async def _ready(self) -> "StubRedis":
+        return self
+    
+    async def ping(self) -> bool:
+        """Record the ping."""
+        self.pinged = True
+        return True
+    
+    async def close(self) -> None:
+        """Record the close call."""
+        self.closed = True
+
+
+class FakeGitRepo:
+    """Stand-in for git.Repo: opening, cloning and pulling never touch git."""
+    
+    def __init__(self, path=None):
+        self.path = path
+        self.remotes = SimpleNamespace(
+            origin=SimpleNamespace(pull=lambda *args, **kwargs: [], set_url=lambda url: None)
+        )
+        self.git = SimpleNamespace(custom_environment=lambda **env: nullcontext())
+    
+    @classmethod
+    def clone_from(cls, url, to_path, **kwargs) -> "FakeGitRepo":
+        """Pretend to clone ``url`` into ``to_path``."""
+        return cls(to_path)
+
+
+def fake_connect(*results):
+    """Build an async stand-in for a driver ``connect`` function.
+    
+    Each call returns the next value from ``results``; exception instances
+    are raised instead of returned.
+    """
+    pending = iter(results)
+    
+    async def connect(*args, **kwargs):
+        result = next(pending)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    
+    return connect
+
+
+def run_sync(coro):
+    """Run a coroutine that never suspends and return its result.
+    
+    For async APIs whose body does no I/O (e.g. string building); avoids
+    scheduling the test on the event loop.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("coroutine suspended; run it as an async test instead")
+
+
+@dataclass(slots=True)
+class FakeRun:
+    """Stand-in for subprocess.run that records each command.
+    
+    Set ``error`` to make the call raise (e.g. FileNotFoundError).
+    """
+    returncode: int = 0
+    stdout: str = ""
+    stderr: str = ""
+    error: Optional[BaseException] = None
+    calls: List[List[str]] = field(default_factory=list)
+    
+    def __call__(self, cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        self.calls.append(cmd)
+        if self.error:
+            raise self.error
+        return subprocess.CompletedProcess(cmd, self.returncode, self.stdout, self.stderr)
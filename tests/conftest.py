@@ -16,9 +16,54 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import asyncio
+import inspect
 import pytest
 from pathlib import Path
 
+from tests._fakes import FakeGitRepo, StubMongoClient, StubRedis
+
+
+def pytest_collection_modifyitems(items):
+    """Give only async tests the task-cleanup fixture; sync tests skip the event loop."""
+    for item in items:
+        if inspect.iscoroutinefunction(getattr(item, "obj", None)):
+            item.fixturenames.append("cancel_pending_tasks")
+
+
+@pytest.fixture
+async def cancel_pending_tasks():
+    """Cancel tasks the test started and left behind on the shared session event loop."""
+    existing = asyncio.all_tasks()
+    yield
+    current = asyncio.current_task()
+    pending = [
+        task for task in asyncio.all_tasks()
+        if task not in existing and task is not current and not task.done()
+    ]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+@pytest.fixture
+def mongo_client_stub():
+    """Fresh recording stand-in for AsyncIOMotorClient."""
+    return StubMongoClient()
+
+
+@pytest.fixture
+def redis_stub():
+    """Fresh recording stand-in for a redis.asyncio client."""
+    return StubRedis()
+
+
+@pytest.fixture
+def mock_git(monkeypatch):
+    """Swap the scanner's git.Repo for FakeGitRepo by direct attribute assignment."""
+    monkeypatch.setattr("gravity_framework.discovery.scanner.git.Repo", FakeGitRepo)
+    return FakeGitRepo
+
 
 @pytest.fixture
 def test_project_dir(tmp_path):
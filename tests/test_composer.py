@@ -81,7 +81,6 @@ def sample_services():
     return [auth_service, user_service]
 
 
-@pytest.mark.asyncio
 async def test_generate_compose_config(sample_services):
     """Test generating docker-compose configuration."""
     generator = DockerComposeGenerator(base_port=8001)
@@ -100,7 +99,6 @@ async def test_generate_compose_config(sample_services):
     assert "user_db_data" in config["volumes"]
 
 
-@pytest.mark.asyncio
 async def test_database_services_generated(sample_services):
     """Test that database services are correctly generated."""
     generator = DockerComposeGenerator()
@@ -121,7 +119,6 @@ async def test_database_services_generated(sample_services):
     assert services["auth_cache-db"]["image"].startswith("redis:")
 
 
-@pytest.mark.asyncio
 async def test_service_dependencies(sample_services):
     """Test that service dependencies are correctly set."""
     generator = DockerComposeGenerator()
@@ -141,7 +138,6 @@ async def test_service_dependencies(sample_services):
     assert "auth-service" in user_depends
 
 
-@pytest.mark.asyncio
 async def test_environment_variables(sample_services):
     """Test that environment variables are correctly generated."""
     generator = DockerComposeGenerator()
@@ -164,7 +160,6 @@ async def test_environment_variables(sample_services):
     assert "http://auth-service:" in user_env["AUTH_SERVICE_URL"]
 
 
-@pytest.mark.asyncio
 async def test_port_allocation(sample_services):
     """Test that ports are correctly allocated."""
     generator = DockerComposeGenerator(base_port=9000)
@@ -181,7 +176,6 @@ async def test_port_allocation(sample_services):
     assert "9001:8000" in user_ports
 
 
-@pytest.mark.asyncio
 async def test_health_checks(sample_services):
     """Test that health checks are correctly configured."""
     generator = DockerComposeGenerator()
@@ -201,7 +195,6 @@ async def test_health_checks(sample_services):
     assert "pg_isready" in " ".join(postgres_health["test"])
 
 
-@pytest.mark.asyncio
 async def test_collect_databases(sample_services):
     """Test database collection with deduplication."""
     generator = DockerComposeGenerator()
@@ -215,7 +208,6 @@ async def test_collect_databases(sample_services):
     assert "user_db" in db_names
 
 
-@pytest.mark.asyncio
 async def test_mysql_database():
     """Test MySQL database configuration."""
     manifest = ServiceManifest(
@@ -238,7 +230,6 @@ async def test_mysql_database():
     assert mysql_service["environment"]["MYSQL_DATABASE"] == "test_db"
 
 
-@pytest.mark.asyncio
 async def test_mongodb_database():
     """Test MongoDB database configuration."""
     manifest = ServiceManifest(
@@ -261,7 +252,6 @@ async def test_mongodb_database():
     assert mongo_service["environment"]["MONGO_INITDB_DATABASE"] == "test_db"
 
 
-@pytest.mark.asyncio
 async def test_write_file(sample_services, tmp_path):
     """Test writing docker-compose.yml to file."""
     generator = DockerComposeGenerator()
@@ -279,7 +269,6 @@ async def test_write_file(sample_services, tmp_path):
     assert "user-service:" in content
 
 
-@pytest.mark.asyncio
 async def test_generate_env_template(sample_services):
     """Test .env.example generation."""
     generator = DockerComposeGenerator()
@@ -16,7 +16,6 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from gravity_framework.core.framework import GravityFramework
 from gravity_framework.models.service import (
@@ -70,7 +69,6 @@ class TestFrameworkCoverage:
             
             assert services == []
     
-    @pytest.mark.asyncio
     async def test_install_no_services(self, tmp_path):
         """Test install with no services (lines 124-126)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -81,7 +79,6 @@ class TestFrameworkCoverage:
         # Should return True even with no services
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_install_dependency_resolution_fails(self, tmp_path):
         """Test install when dependency resolution fails (lines 127-129)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -104,7 +101,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_install_database_setup_fails(self, tmp_path):
         """Test install when database setup fails (lines 139-142)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -127,7 +123,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_install_service_installation_fails(self, tmp_path):
         """Test install when service installation fails (lines 144-146)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -148,7 +143,6 @@ class TestFrameworkCoverage:
                 
                 assert result is False
     
-    @pytest.mark.asyncio
     async def test_start_no_services(self, tmp_path):
         """Test start with no services (lines 184-185)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -158,7 +152,6 @@ class TestFrameworkCoverage:
         # Should return True even with no services
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_start_dependency_resolution_fails(self, tmp_path):
         """Test start when dependency resolution fails (lines 193-195)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -182,7 +175,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_start_service_fails(self, tmp_path):
         """Test start when a service fails to start (lines 210-212)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -207,7 +199,6 @@ class TestFrameworkCoverage:
                 
                 assert result is False
     
-    @pytest.mark.asyncio
     async def test_stop_no_running_services(self, tmp_path):
         """Test stop with no running services (lines 240-241)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -227,7 +218,6 @@ class TestFrameworkCoverage:
         # Should return True even with no running services
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_stop_dependency_resolution_returns_none(self, tmp_path):
         """Test stop when dependency resolution returns None (lines 247-249)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -253,7 +243,6 @@ class TestFrameworkCoverage:
                 # Should still succeed and use original services list
                 assert result is True
     
-    @pytest.mark.asyncio
     async def test_restart_stop_fails(self, tmp_path):
         """Test restart when stop fails (line 273)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -263,7 +252,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_logs_service_not_found(self, tmp_path):
         """Test logs for non-existent service (line 322)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -272,7 +260,6 @@ class TestFrameworkCoverage:
         
         assert "Service not found" in result
     
-    @pytest.mark.asyncio
     async def test_health_check_specific_service_not_found(self, tmp_path):
         """Test health check for non-existent service (line 340)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -281,7 +268,6 @@ class TestFrameworkCoverage:
         
         assert result == {"non-existent-service": False}
     
-    @pytest.mark.asyncio
     async def test_health_check_specific_service_exists(self, tmp_path):
         """Test health check for specific existing service (lines 342-343)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -300,7 +286,6 @@ class TestFrameworkCoverage:
             
             assert result == {"test-service": True}
     
-    @pytest.mark.asyncio
     async def test_health_check_all_services(self, tmp_path):
         """Test health check for all services (lines 345-349)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -321,7 +306,6 @@ class TestFrameworkCoverage:
             assert len(result) == 3
             assert all(result.values())  # All should be healthy
     
-    @pytest.mark.asyncio
     async def test_start_with_database_environment_variables(self, tmp_path):
         """Test start adds database URLs as environment variables (lines 196-205)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -363,7 +347,6 @@ class TestFrameworkCoverage:
             # Should return empty list on exception
             assert services == []
     
-    @pytest.mark.asyncio
     async def test_install_exception_handling(self, tmp_path):
         """Test install handles exceptions (lines 147-150)."""
         framework = GravityFramework(project_path=tmp_path)
@@ -383,7 +366,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_start_exception_handling(self, tmp_path):
         """Test start handles exceptions."""
         framework = GravityFramework(project_path=tmp_path)
@@ -404,7 +386,6 @@ class TestFrameworkCoverage:
             
             assert result is False
     
-    @pytest.mark.asyncio
     async def test_stop_exception_handling(self, tmp_path):
         """Test stop handles exceptions."""
         framework = GravityFramework(project_path=tmp_path)
@@ -16,7 +16,6 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from gravity_framework.core.framework import GravityFramework
 from gravity_framework.models.service import (
@@ -51,7 +50,6 @@ class TestFrameworkExtended:
             # Installation method exists
             assert framework.registry.get_service("test-service") is not None
     
-    @pytest.mark.asyncio
     async def test_start_services(self, tmp_path):
         """Test starting services."""
         framework = GravityFramework(project_path=tmp_path)
@@ -73,7 +71,6 @@ class TestFrameworkExtended:
             
             assert result is True
     
-    @pytest.mark.asyncio
     async def test_stop_services(self, tmp_path):
         """Test stopping services."""
         framework = GravityFramework(project_path=tmp_path)
@@ -95,7 +92,6 @@ class TestFrameworkExtended:
             
             assert result is True
     
-    @pytest.mark.asyncio
     async def test_restart_service(self, tmp_path):
         """Test restarting a service."""
         framework = GravityFramework(project_path=tmp_path)
@@ -117,7 +113,6 @@ class TestFrameworkExtended:
             
             assert result is True
     
-    @pytest.mark.asyncio
     async def test_get_logs(self, tmp_path):
         """Test getting service logs."""
         framework = GravityFramework(project_path=tmp_path)
@@ -139,7 +134,6 @@ class TestFrameworkExtended:
             
             assert logs == "Test log output"
     
-    @pytest.mark.asyncio
     async def test_health_check(self, tmp_path):
         """Test health check."""
         framework = GravityFramework(project_path=tmp_path)
@@ -212,7 +206,6 @@ repository: https://github.com/test/test
             assert len(services) == 1
             assert services[0].manifest.name == "test-service"
     
-    @pytest.mark.asyncio
     async def test_install_with_dependencies(self, tmp_path):
         """Test installing services with dependencies."""
         framework = GravityFramework(project_path=tmp_path)
@@ -239,7 +232,6 @@ repository: https://github.com/test/test
             
             assert result is True
     
-    @pytest.mark.asyncio
     async def test_install_with_databases(self, tmp_path):
         """Test installing service that requires databases."""
         framework = GravityFramework(project_path=tmp_path)
@@ -266,7 +258,6 @@ repository: https://github.com/test/test
             
             assert result is True
     
-    @pytest.mark.asyncio
     async def test_get_all_services(self, tmp_path):
         """Test get_all_services method."""
         framework = GravityFramework(project_path=tmp_path)
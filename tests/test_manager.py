@@ -16,11 +16,46 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-    client = Mock()
-    client.containers = Mock()
-    client.images = Mock()
-    client.networks = Mock()
-    return client
+import pytest
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, AsyncMock
+
+from gravity_framework.core.manager import ServiceManager
+from tests._fakes import FakeContainer
+from gravity_framework.models.service import (
+    Service,
+    ServiceManifest,
+    ServiceType,
+    ServiceStatus,
+    ServicePort,
+    HealthCheck
+)
+
+
+def _completed(returncode=0, stdout="", stderr=""):
+    """Create a finished install command result."""
+    return subprocess.CompletedProcess([], returncode, stdout, stderr)
+
+
+@pytest.fixture
+def mock_container():
+    """Create fake running container."""
+    return FakeContainer()
+
+
+@pytest.fixture
+def mock_docker_client(mock_container):
+    """Create fake Docker client.
+    
+    Plain namespaces are enough here since no test inspects the calls.
+    """
+    image = SimpleNamespace(id="image-id")
+    return SimpleNamespace(
+        containers=SimpleNamespace(run=lambda *args, **kwargs: mock_container),
+        images=SimpleNamespace(build=lambda *args, **kwargs: (image, [])),
+        networks=SimpleNamespace()
+    )
 
 
 @pytest.fixture
@@ -69,7 +104,6 @@ class TestServiceManager:
             _ = manager.docker_client
             mock_from_env.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_install_service_success(self, service_manager, sample_service):
         """Test successful service installation."""
         with patch('pathlib.Path.exists', return_value=False):
@@ -78,51 +112,41 @@ class TestServiceManager:
         assert result is True
         assert sample_service.status == ServiceStatus.INSTALLED
     
-    @pytest.mark.asyncio
     async def test_install_service_with_script(self, service_manager, sample_service):
         """Test installation with install script."""
         sample_service.manifest.install_script = "setup.sh"
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('subprocess.run') as mock_run:
-            
-            mock_run.return_value = Mock(returncode=0, stdout="Success", stderr="")
+        service_manager._runner = AsyncMock(return_value=_completed(returncode=0, stdout="Success"))
+        
+        with patch('pathlib.Path.exists', return_value=True):
             result = await service_manager.install_service(sample_service)
             
             assert result is True
             assert sample_service.status == ServiceStatus.INSTALLED
     
-    @pytest.mark.asyncio
     async def test_install_service_failure(self, service_manager, sample_service):
         """Test service installation failure."""
         sample_service.manifest.install_script = "setup.sh"
         
-        with patch('pathlib.Path.exists', return_value=True), \
-             patch('subprocess.run') as mock_run:
-            
-            mock_run.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        service_manager._runner = AsyncMock(return_value=_completed(returncode=1, stderr="Error"))
+        
+        with patch('pathlib.Path.exists', return_value=True):
             result = await service_manager.install_service(sample_service)
             
             assert result is False
             assert sample_service.status == ServiceStatus.ERROR
     
-    @pytest.mark.asyncio
     async def test_start_service_success(self, service_manager, sample_service):
         """Test successful service start."""
         sample_service.status = ServiceStatus.INSTALLED
         
-        mock_container = Mock()
-        mock_container.id = "container-id"
-        mock_container.status = "running"
-        service_manager.docker_client.containers.run.return_value = mock_container
-        
         with patch.object(service_manager, '_wait_for_health', return_value=True):
             result = await service_manager.start_service(sample_service)
         
         assert result is True
         assert sample_service.status == ServiceStatus.RUNNING
+        assert sample_service.container_id == "container-id"
     
-    @pytest.mark.asyncio
     async def test_find_free_port(self, service_manager):
         """Test finding free port."""
         port = service_manager._find_free_port()
@@ -16,108 +16,145 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import httpx
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock
 from gravity_framework.core.manager import ServiceManager
+from tests._fakes import FakeContainer
 from gravity_framework.models.service import (
     Service,
     ServiceManifest,
-    ServicePort,
-    ServiceStatus
+    ServiceStatus,
+    ServicePort
 )
 
 
+_BASE_MANIFEST_KW = dict(
+    name="test-service",
+    version="1.0.0",
+    repository="https://github.com/test/test"
+)
+
+
+@pytest.fixture(scope="module")
+def base_manifest():
+    """Validated once; tests derive variants with model_copy(update=...)."""
+    return ServiceManifest(**_BASE_MANIFEST_KW)
+
+
+def _docker_stub():
+    """Create a plain Mock Docker client with only the collections the manager uses."""
+    client = Mock()
+    client.containers = Mock()
+    client.images = Mock()
+    return client
+
+
+@pytest.fixture(scope="session")
+def install_script_dir(tmp_path_factory):
+    """Service directory with a succeeding install script, created once."""
+    path = tmp_path_factory.mktemp("test-service")
+    (path / "install.sh").write_text("#!/bin/bash\necho 'Installing...'")
+    return path
+
+
+@pytest.fixture(scope="session")
+def install_script_fail_dir(tmp_path_factory):
+    """Service directory with a failing install script, created once."""
+    path = tmp_path_factory.mktemp("test-service-fail")
+    (path / "install.sh").write_text("#!/bin/bash\necho 'Install failed' >&2\nexit 1")
+    return path
+
+
+@pytest.fixture(scope="class")
+def manager():
+    """ServiceManager with a stubbed Docker client, shared by the test class."""
+    return ServiceManager(docker_client=_docker_stub())
+
+
+@pytest.fixture(scope="session")
+def bare_manager():
+    """ServiceManager without a Docker client, for paths that never reach Docker."""
+    return ServiceManager()
+
+
+@pytest.fixture(autouse=True)
+def reset_manager(manager, bare_manager):
+    """Reset the shared managers after each test."""
+    yield
+    bare_manager.containers.clear()
+    manager.docker_client.reset_mock(return_value=True, side_effect=True)
+    manager.containers.clear()
+    manager._http_client = None
+    manager._http_transport = None
+
+
+# (method, service setup, expected result) for branches that bail out early
+EARLY_RETURN_CASES = [
+    ("install_service", lambda s: setattr(s, "path", None), False),
+    ("start_service", lambda s: None, False),
+    ("stop_service", lambda s: setattr(s, "container_id", None), True),
+    ("get_service_logs", lambda s: setattr(s, "container_id", None), "No container running"),
+    ("check_health", lambda s: setattr(s, "assigned_ports", {"8000": 8000}), False),
+]
+
+
 class TestManagerCoverage:
     """Tests to improve manager.py coverage."""
     
-    @pytest.mark.asyncio
-    async def test_install_service_no_path(self):
-        """Test installing service without path set (lines 48-49)."""
-        manager = ServiceManager()
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-        )
-        service = Service(manifest=manifest)
-        service.path = None  # No path set
-        
-        result = await manager.install_service(service)
-        
-        assert result is False
+    @pytest.mark.parametrize(
+        "method,setup,expected",
+        EARLY_RETURN_CASES,
+        ids=[case[0] for case in EARLY_RETURN_CASES]
+    )
+    async def test_early_return_paths(self, bare_manager, base_manifest, method, setup, expected):
+        """Test methods bail out when path, runtime, container or health check is missing."""
+        service = Service(manifest=base_manifest)
+        setup(service)
+        
+        result = await getattr(bare_manager, method)(service)
+        
+        assert result == expected
+        # None of these paths should need a Docker client
+        assert bare_manager._docker_client is None
     
-    @pytest.mark.asyncio
-    async def test_install_service_with_install_script(self, tmp_path):
+    async def test_install_service_with_install_script(self, manager, base_manifest, install_script_dir):
         """Test installing service with install script (lines 93, 109)."""
-        manager = ServiceManager()
-        
-        # Create service directory and install script
-        service_path = tmp_path / "test-service"
-        service_path.mkdir()
-        install_script = service_path / "install.sh"
-        install_script.write_text("#!/bin/bash\necho 'Installing...'")
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            install_script="install.sh"
-        )
+        manifest = base_manifest.model_copy(update={
+            "install_script": "install.sh"
+        })
         service = Service(manifest=manifest)
-        service.path = str(service_path)
+        service.path = str(install_script_dir)
+        
+        # Runs the real script through _run_command
+        result = await manager.install_service(service)
         
-        # Mock subprocess
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = await manager.install_service(service)
-            
-            mock_run.assert_called_once()
-            assert result is True
-            assert service.status == ServiceStatus.INSTALLED
+        assert result is True
+        assert service.status == ServiceStatus.INSTALLED
     
-    @pytest.mark.asyncio
-    async def test_install_service_script_fails(self, tmp_path):
+    async def test_install_service_script_fails(self, manager, base_manifest, install_script_fail_dir):
         """Test install service when install script fails (lines 115-124)."""
-        manager = ServiceManager()
-        
-        service_path = tmp_path / "test-service"
-        service_path.mkdir()
-        install_script = service_path / "install.sh"
-        install_script.write_text("#!/bin/bash\nexit 1")
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            install_script="install.sh"
-        )
+        manifest = base_manifest.model_copy(update={
+            "install_script": "install.sh"
+        })
         service = Service(manifest=manifest)
-        service.path = str(service_path)
+        service.path = str(install_script_fail_dir)
+        
+        # Runs the real script through _run_command
+        result = await manager.install_service(service)
         
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=1)
-            
-            result = await manager.install_service(service)
-            
-            assert result is False
-            assert service.status == ServiceStatus.ERROR
+        assert result is False
+        assert service.status == ServiceStatus.ERROR
+        assert service.error_message.strip() == "Install failed"
     
-    @pytest.mark.asyncio
-    async def test_start_service_with_env_vars(self, tmp_path):
+    async def test_start_service_with_env_vars(self, manager, base_manifest, tmp_path):
         """Test starting service with environment variables (lines 139-140)."""
-        manager = ServiceManager(docker_client=MagicMock())
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            runtime="python:3.11",
-            command="python app.py",
-            ports=[ServicePort(container=8000, host=8000)]
-        )
+        manifest = base_manifest.model_copy(update={
+            "runtime": "python:3.11",
+            "command": "python app.py",
+            "ports": [ServicePort(container=8000, host=8000)]
+        })
         service = Service(manifest=manifest)
         service.path = str(tmp_path)
         
@@ -126,9 +163,7 @@ class TestManagerCoverage:
             "REDIS_URL": "redis://localhost:6379"
         }
         
-        mock_container = MagicMock()
-        mock_container.id = "abc123"
-        manager.docker_client.containers.run = MagicMock(return_value=mock_container)
+        manager.docker_client.containers.run = Mock(return_value=FakeContainer(id="abc123"))
         
         result = await manager.start_service(service, env_vars)
         
@@ -137,40 +172,17 @@ class TestManagerCoverage:
         call_kwargs = manager.docker_client.containers.run.call_args[1]
         assert "environment" in call_kwargs
     
-    @pytest.mark.asyncio
-    async def test_start_service_no_runtime(self):
-        """Test starting service without runtime specified (lines 152-156)."""
-        manager = ServiceManager()
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-            # No runtime specified
-        )
-        service = Service(manifest=manifest)
-        
-        result = await manager.start_service(service)
-        
-        assert result is False
-    
-    @pytest.mark.asyncio
-    async def test_start_service_exception(self, tmp_path):
+    async def test_start_service_exception(self, manager, base_manifest, tmp_path):
         """Test start_service handles exceptions (lines 179-193)."""
-        manager = ServiceManager(docker_client=MagicMock())
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            runtime="python:3.11",
-            command="python app.py"
-        )
+        manifest = base_manifest.model_copy(update={
+            "runtime": "python:3.11",
+            "command": "python app.py"
+        })
         service = Service(manifest=manifest)
         service.path = str(tmp_path)
         
         # Mock Docker client to raise exception
-        manager.docker_client.containers.run = MagicMock(side_effect=Exception("Docker error"))
+        manager.docker_client.containers.run = Mock(side_effect=Exception("Docker error"))
         
         result = await manager.start_service(service)
         
@@ -178,59 +190,26 @@ class TestManagerCoverage:
         assert service.status == ServiceStatus.ERROR
         assert "Docker error" in service.error_message
     
-    @pytest.mark.asyncio
-    async def test_stop_service_not_running(self):
-        """Test stopping service that isn't running (lines 229-231)."""
-        manager = ServiceManager()
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-        )
-        service = Service(manifest=manifest)
-        service.container_id = None  # Not running
-        
-        await manager.stop_service(service)
-        
-        # Should complete without error
-        assert service.container_id is None
-    
-    @pytest.mark.asyncio
-    async def test_stop_service_exception(self):
+    async def test_stop_service_exception(self, manager, base_manifest):
         """Test stop_service handles exceptions (lines 236-243)."""
-        manager = ServiceManager(docker_client=MagicMock())
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-        )
-        service = Service(manifest=manifest)
+        service = Service(manifest=base_manifest)
         service.container_id = "abc123"
         
-        # Mock container that raises exception
-        mock_container = MagicMock()
-        mock_container.stop = MagicMock(side_effect=Exception("Stop failed"))
-        manager.docker_client.containers.get = MagicMock(return_value=mock_container)
+        # Container that raises exception
+        container = FakeContainer(id="abc123", error=Exception("Stop failed"))
+        manager.docker_client.containers.get = Mock(return_value=container)
         
         await manager.stop_service(service)
         
         # Should handle exception gracefully
         assert service.status == ServiceStatus.ERROR
     
-    @pytest.mark.asyncio
-    async def test_restart_service(self):
+    async def test_restart_service(self, manager, base_manifest):
         """Test restarting a service (lines 271-279)."""
-        manager = ServiceManager(docker_client=MagicMock())
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            runtime="python:3.11",
-            command="python app.py"
-        )
+        manifest = base_manifest.model_copy(update={
+            "runtime": "python:3.11",
+            "command": "python app.py"
+        })
         service = Service(manifest=manifest)
         service.path = "/tmp/test-service"
         service.container_id = "abc123"
@@ -244,87 +223,35 @@ class TestManagerCoverage:
                 mock_start.assert_called_once_with(service)
                 assert result is True
     
-    @pytest.mark.asyncio
-    async def test_get_service_logs_no_container(self):
-        """Test getting logs when service has no container (lines 316-318)."""
-        manager = ServiceManager()
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-        )
-        service = Service(manifest=manifest)
-        service.container_id = None
-        
-        logs = await manager.get_service_logs(service)
-        
-        assert "No container running" in logs
-    
-    @pytest.mark.asyncio
-    async def test_get_service_logs_exception(self):
+    async def test_get_service_logs_exception(self, manager, base_manifest):
         """Test get_service_logs handles exceptions (lines 341-342)."""
-        manager = ServiceManager(docker_client=MagicMock())
-        
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-        )
-        service = Service(manifest=manifest)
+        service = Service(manifest=base_manifest)
         service.container_id = "abc123"
         
-        # Mock container that raises exception
-        mock_container = MagicMock()
-        mock_container.logs = MagicMock(side_effect=Exception("Logs error"))
-        manager.docker_client.containers.get = MagicMock(return_value=mock_container)
+        # Container that raises exception
+        container = FakeContainer(id="abc123", error=Exception("Logs error"))
+        manager.docker_client.containers.get = Mock(return_value=container)
         
         logs = await manager.get_service_logs(service)
         
         assert "Error" in logs
     
-    @pytest.mark.asyncio
-    async def test_check_health_no_health_check_config(self):
-        """Test health check when service has no health check configured (lines 357-358)."""
-        manager = ServiceManager()
+    async def test_check_health_exception(self, manager, base_manifest):
+        """Test check_health handles exceptions (line 371)."""
+        from gravity_framework.models.service import HealthCheck
         
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test"
-            # No health_check configured
-        )
+        manifest = base_manifest.model_copy(update={
+            "health_check": HealthCheck(endpoint="/health")
+        })
         service = Service(manifest=manifest)
-        service.container_id = "abc123"
         service.assigned_ports = {"8000": 8000}
         
-        result = await manager.check_health(service)
-        
-        # When no health_check configured, check_health returns False
-        # because it tries to build URL from health_check.endpoint which is None
-        assert result is False
-    
-    @pytest.mark.asyncio
-    async def test_check_health_exception(self):
-        """Test check_health handles exceptions (line 371)."""
-        manager = ServiceManager()
+        def handler(request):
+            raise httpx.ConnectError("Connection refused", request=request)
         
-        from gravity_framework.models.service import HealthCheck
+        manager._http_transport = httpx.MockTransport(handler)
         
-        manifest = ServiceManifest(
-            name="test-service",
-            version="1.0.0",
-            repository="https://github.com/test/test",
-            health_check=HealthCheck(endpoint="/health")
-        )
-        service = Service(manifest=manifest)
-        service.assigned_ports = {"8000": 8000}
+        result = await manager.check_health(service)
+        await manager.aclose()
         
-        # Mock httpx to raise exception
-        with patch('httpx.AsyncClient') as MockClient:
-            mock_client = MockClient.return_value.__aenter__.return_value
-            mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
-            
-            result = await manager.check_health(service)
-            
-            assert result is False
+        assert result is False
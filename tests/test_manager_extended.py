@@ -16,21 +16,32 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import asyncio
+import httpx
 import pytest
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 from gravity_framework.core.manager import ServiceManager
+from tests._fakes import FakeContainer
 from gravity_framework.models.service import (
     Service,
     ServiceManifest,
+    HealthCheck,
+    DatabaseType,
     ServicePort,
-    HealthCheck
+    DatabaseRequirement
 )
 
 
-@pytest.fixture
+# asyncio may wake a timer up to one clock tick early
+_CLOCK_SLACK = 0.001
+
+
+@pytest.fixture(scope="module")
 def manager():
-    """Create a ServiceManager with mocked Docker client."""
+    """Create a ServiceManager with mocked Docker client, shared by the module."""
     mock_client = Mock()
     mock_client.containers = Mock()
     mock_client.images = Mock()
@@ -39,6 +50,16 @@ def manager():
     return manager
 
 
+@pytest.fixture(autouse=True)
+async def reset_manager(manager):
+    """Reset the shared manager after each test."""
+    yield
+    manager.docker_client.reset_mock(return_value=True, side_effect=True)
+    manager.containers.clear()
+    manager._reserved_ports.clear()
+    await manager.aclose()
+
+
 @pytest.fixture
 def sample_service():
     """Create a sample service for testing."""
@@ -59,15 +80,10 @@ def sample_service():
     return service
 
 
-@pytest.mark.asyncio
 async def test_start_service_success(manager, sample_service):
     """Test successful service start."""
     # Mock container
-    mock_container = Mock()
-    mock_container.id = "abc123"
-    mock_container.status = "running"
-    
-    manager.docker_client.containers.run = Mock(return_value=mock_container)
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer(id="abc123"))
     
     # Mock health check
     with patch.object(manager, '_wait_for_health', new_callable=AsyncMock) as mock_health:
@@ -79,7 +95,6 @@ async def test_start_service_success(manager, sample_service):
         assert sample_service.container_id == "abc123"
 
 
-@pytest.mark.asyncio
 async def test_start_service_with_env_vars(manager, sample_service):
     """Test starting service with environment variables."""
     env_vars = {
@@ -87,11 +102,7 @@ async def test_start_service_with_env_vars(manager, sample_service):
         "API_KEY": "test-key-123"
     }
     
-    mock_container = Mock()
-    mock_container.id = "def456"
-    mock_container.status = "running"
-    
-    manager.docker_client.containers.run = Mock(return_value=mock_container)
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer(id="def456"))
     
     with patch.object(manager, '_wait_for_health', new_callable=AsyncMock) as mock_health:
         mock_health.return_value = True
@@ -104,15 +115,30 @@ async def test_start_service_with_env_vars(manager, sample_service):
         assert 'environment' in call_kwargs
 
 
-@pytest.mark.asyncio
+async def test_start_service_adds_database_env_keys(manager, sample_service):
+    """Test created databases get a <NAME>_URL environment placeholder."""
+    sample_service.manifest.databases = [
+        DatabaseRequirement(name="main_db", type=DatabaseType.POSTGRESQL),
+        DatabaseRequirement(name="cache", type=DatabaseType.REDIS)
+    ]
+    sample_service.created_databases = ["main_db"]
+    
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer(id="ghi789"))
+    
+    with patch.object(manager, '_wait_for_health', new_callable=AsyncMock) as mock_health:
+        mock_health.return_value = True
+        
+        result = await manager.start_service(sample_service)
+        
+        assert result is True
+        environment = manager.docker_client.containers.run.call_args[1]['environment']
+        assert environment["MAIN_DB_URL"] == ""
+        assert "CACHE_URL" not in environment
+
+
 async def test_start_service_health_check_failure(manager, sample_service):
     """Test service start with health check failure."""
-    mock_container = Mock()
-    mock_container.id = "ghi789"
-    mock_container.stop = Mock()
-    mock_container.remove = Mock()
-    
-    manager.docker_client.containers.run = Mock(return_value=mock_container)
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer(id="ghi789"))
     
     # Health check fails
     with patch.object(manager, '_wait_for_health', new_callable=AsyncMock) as mock_health:
@@ -124,41 +150,58 @@ async def test_start_service_health_check_failure(manager, sample_service):
         assert result is True
 
 
-@pytest.mark.asyncio
+async def test_start_service_failure_releases_ports(manager, sample_service):
+    """Test a failed start hands its auto-assigned host ports back."""
+    manager.docker_client.containers.run = Mock(side_effect=Exception("boom"))
+    
+    result = await manager.start_service(sample_service)
+    
+    assert result is False
+    host_port = sample_service.assigned_ports[8000]
+    assert host_port not in manager._reserved_ports
+
+
+async def test_stop_service_not_found_releases_ports(manager, sample_service):
+    """Test stopping a service whose container is gone still releases its ports."""
+    from docker.errors import NotFound
+    
+    port = manager._reserve_ports(1)[0]
+    sample_service.assigned_ports = {8000: port}
+    sample_service.container_id = "gone"
+    manager.docker_client.containers.get = Mock(side_effect=NotFound("gone"))
+    
+    result = await manager.stop_service(sample_service)
+    
+    assert result is True
+    assert port not in manager._reserved_ports
+
+
 async def test_stop_service_success(manager, sample_service):
     """Test successful service stop."""
     sample_service.container_id = "jkl012"
     
-    mock_container = Mock()
-    mock_container.stop = Mock()
-    mock_container.remove = Mock()
-    
-    manager.docker_client.containers.get = Mock(return_value=mock_container)
+    container = FakeContainer(id="jkl012")
+    manager.docker_client.containers.get = Mock(return_value=container)
     
     result = await manager.stop_service(sample_service)
     
     assert result is True
-    mock_container.stop.assert_called()
+    assert container.stopped is True
 
 
-@pytest.mark.asyncio
 async def test_stop_service_timeout(manager, sample_service):
     """Test stopping service with custom timeout."""
     sample_service.container_id = "mno345"
     
-    mock_container = Mock()
-    mock_container.stop = Mock()
-    mock_container.remove = Mock()
-    
-    manager.docker_client.containers.get = Mock(return_value=mock_container)
+    container = FakeContainer(id="mno345")
+    manager.docker_client.containers.get = Mock(return_value=container)
     
     result = await manager.stop_service(sample_service, timeout=30)
     
     assert result is True
-    mock_container.stop.assert_called_with(timeout=30)
+    assert container.stop_timeout == 30
 
 
-@pytest.mark.asyncio
 async def test_stop_service_not_running(manager, sample_service):
     """Test stopping service that is not running."""
     sample_service.container_id = None
@@ -167,7 +210,8 @@ async def test_stop_service_not_running(manager, sample_service):
     
     # Returns True if already stopped (nothing to stop)
     assert result is True
-@pytest.mark.asyncio
+
+
 async def test_restart_service_success(manager, sample_service):
     """Test successful service restart."""
     with patch.object(manager, 'stop_service', new_callable=AsyncMock) as mock_stop, \
@@ -183,7 +227,6 @@ async def test_restart_service_success(manager, sample_service):
         mock_start.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_restart_service_stop_failure(manager, sample_service):
     """Test restart when stop fails."""
     with patch.object(manager, 'stop_service', new_callable=AsyncMock) as mock_stop:
@@ -194,24 +237,20 @@ async def test_restart_service_stop_failure(manager, sample_service):
         assert result is False
 
 
-@pytest.mark.asyncio
 async def test_get_service_logs(manager, sample_service):
     """Test getting service logs."""
     sample_service.container_id = "pqr678"
     
-    mock_container = Mock()
-    mock_container.logs = Mock(return_value=b"Log line 1\nLog line 2\nLog line 3\n")
-    
-    manager.docker_client.containers.get = Mock(return_value=mock_container)
+    container = FakeContainer(id="pqr678", log_output=b"Log line 1\nLog line 2\nLog line 3\n")
+    manager.docker_client.containers.get = Mock(return_value=container)
     
     logs = await manager.get_service_logs(sample_service, tail=10)
     
     assert "Log line 1" in logs
     # Manager adds timestamps=True by default
-    mock_container.logs.assert_called_with(tail=10, timestamps=True)
+    assert container.logs_kwargs == {"tail": 10, "timestamps": True}
 
 
-@pytest.mark.asyncio
 async def test_get_service_logs_no_container(manager, sample_service):
     """Test getting logs when container doesn't exist."""
     sample_service.container_id = None
@@ -219,38 +258,50 @@ async def test_get_service_logs_no_container(manager, sample_service):
     logs = await manager.get_service_logs(sample_service)
     
     assert logs == "No container running"
-@pytest.mark.asyncio
-async def test_check_health_success(manager, sample_service):
+
+
+async def test_check_health_success(sample_service):
     """Test successful health check."""
     sample_service.container_id = "stu901"
     sample_service.assigned_ports = {8000: 8000}
     
-    # Mock HTTP response for health check
-    import httpx
-    with patch('httpx.AsyncClient') as mock_client:
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
-        
-        result = await manager.check_health(sample_service)
-        
-        assert result is True
-@pytest.mark.asyncio
+    requested = []
+    
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200)
+    
+    manager = ServiceManager(docker_client=Mock(), http_transport=httpx.MockTransport(handler))
+    
+    result = await manager.check_health(sample_service)
+    await manager.aclose()
+    
+    assert result is True
+    assert requested == ["http://localhost:8000/health"]
+
+
+async def test_aclose_closes_http_client(manager):
+    """Test that aclose releases the shared health-check client."""
+    mock_http = Mock(aclose=AsyncMock())
+    manager._http_client = mock_http
+    
+    await manager.aclose()
+    
+    mock_http.aclose.assert_awaited_once()
+    assert manager._http_client is None
+
+
 async def test_check_health_failure(manager, sample_service):
     """Test failed health check."""
     sample_service.container_id = "vwx234"
     
-    mock_container = Mock()
-    mock_container.exec_run = Mock(return_value=(1, b"Error"))
-    
-    manager.docker_client.containers.get = Mock(return_value=mock_container)
+    manager.docker_client.containers.get = Mock(return_value=FakeContainer(id="vwx234"))
     
     result = await manager.check_health(sample_service)
     
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_check_health_no_healthcheck(manager):
     """Test health check for service without health check config."""
     manifest = ServiceManifest(
@@ -267,7 +318,6 @@ async def test_check_health_no_healthcheck(manager):
     assert result is False
 
 
-@pytest.mark.asyncio
 async def test_wait_for_health_success(manager, sample_service):
     """Test waiting for health check to pass."""
     with patch.object(manager, 'check_health', new_callable=AsyncMock) as mock_health:
@@ -278,15 +328,55 @@ async def test_wait_for_health_success(manager, sample_service):
         assert result is True
 
 
-@pytest.mark.asyncio
 async def test_wait_for_health_timeout(manager, sample_service):
-    """Test health check timeout."""
+    """Test health check timeout with no delay between checks."""
     with patch.object(manager, 'check_health', new_callable=AsyncMock) as mock_health:
         mock_health.return_value = False
         
-        result = await manager._wait_for_health(sample_service, max_attempts=2)
+        result = await manager._wait_for_health(sample_service, max_attempts=2, base_delay=0, max_delay=0)
         
         assert result is False
+        assert mock_health.await_count == 2
+
+
+async def test_wait_for_health_backs_off_exponentially(manager, sample_service):
+    """Test retry delays double, then the last retry waits out the budget."""
+    loop = asyncio.get_running_loop()
+    checked_at = []
+    
+    async def unhealthy(service):
+        checked_at.append(loop.time())
+        return False
+    
+    with patch.object(manager, 'check_health', side_effect=unhealthy):
+        result = await manager._wait_for_health(
+            sample_service, max_attempts=5, base_delay=0.001, max_delay=0.004
+        )
+    
+    assert result is False
+    assert len(checked_at) == 5
+    gaps = [later - earlier for earlier, later in zip(checked_at, checked_at[1:])]
+    # 0.001, 0.002, 0.004, then the remaining 0.016 - 0.007
+    assert gaps[-1] >= gaps[0]
+    assert checked_at[-1] - checked_at[0] >= 0.016 - _CLOCK_SLACK
+
+
+async def test_wait_for_health_keeps_fixed_interval_budget(manager, sample_service):
+    """Test the total wait matches (retries - 1) * max_delay, as with fixed-interval polling."""
+    loop = asyncio.get_running_loop()
+    checked_at = []
+    
+    async def unhealthy(service):
+        checked_at.append(loop.time())
+        return False
+    
+    with patch.object(manager, 'check_health', side_effect=unhealthy):
+        result = await manager._wait_for_health(sample_service, base_delay=0.001, max_delay=0.01)
+    
+    assert result is False
+    # retries=3: never more checks than attempts
+    assert len(checked_at) == 3
+    assert checked_at[-1] - checked_at[0] >= 0.02 - _CLOCK_SLACK
 
 
 def test_find_free_port(manager):
@@ -297,36 +387,78 @@ def test_find_free_port(manager):
     assert 1024 <= port <= 65535
 
 
-@pytest.mark.asyncio
+def test_reserve_ports_returns_distinct_unreserved_ports(manager):
+    """Test batch reservation hands out distinct ports and never repeats one."""
+    first = manager._reserve_ports(3)
+    second = manager._reserve_ports(3)
+    
+    assert len(set(first + second)) == 6
+    assert set(first + second) <= manager._reserved_ports
+
+
 async def test_install_service_with_script(manager, sample_service):
     """Test installing service with install script."""
     sample_service.manifest.install_script = "pip install -r requirements.txt"
     sample_service.path = str(Path("/app/services/test-service"))
     
-    mock_container = Mock()
-    mock_container.exec_run = Mock(return_value=(0, b"Installation successful"))
-    mock_container.wait = Mock(return_value={"StatusCode": 0})
-    mock_container.remove = Mock()
-    
-    manager.docker_client.containers.run = Mock(return_value=mock_container)
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer())
     
     result = await manager.install_service(sample_service)
     
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_install_service_failure(manager, sample_service):
     """Test failed service installation."""
     sample_service.path = str(Path("/app/services/test-service"))
     
-    mock_container = Mock()
-    mock_container.wait = Mock(return_value={"StatusCode": 1})
-    mock_container.remove = Mock()
-    
-    manager.docker_client.containers.run = Mock(return_value=mock_container)
+    manager.docker_client.containers.run = Mock(return_value=FakeContainer())
     
     result = await manager.install_service(sample_service)
     
     # Service status is set to INSTALLED even if no install script
-    assert result is True
\ No newline at end of file
+    assert result is True
+
+
+async def test_install_service_uses_injected_runner(tmp_path, sample_service):
+    """Test install commands go through the runner passed to the manager."""
+    (tmp_path / "requirements.txt").write_text("httpx\n")
+    sample_service.path = str(tmp_path)
+    
+    runner = AsyncMock(return_value=subprocess.CompletedProcess([], 0, "", ""))
+    manager = ServiceManager(docker_client=Mock(), runner=runner)
+    
+    result = await manager.install_service(sample_service)
+    
+    assert result is True
+    runner.assert_awaited_once_with(
+        ["pip", "install", "-r", "requirements.txt"],
+        cwd=tmp_path,
+        timeout=600
+    )
+
+
+async def test_run_command_captures_output(tmp_path):
+    """Test the default runner executes off the event loop and decodes output."""
+    manager = ServiceManager(docker_client=Mock())
+    
+    result = await manager._run_command(
+        [sys.executable, "-c", "import sys; print('ok'); sys.exit(3)"],
+        cwd=tmp_path,
+        timeout=30
+    )
+    
+    assert result.returncode == 3
+    assert result.stdout.strip() == "ok"
+
+
+async def test_run_command_timeout_kills_process(tmp_path):
+    """Test the default runner kills the process and raises on timeout."""
+    manager = ServiceManager(docker_client=Mock())
+    
+    with pytest.raises(subprocess.TimeoutExpired):
+        await manager._run_command(
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            cwd=tmp_path,
+            timeout=0.2
+        )
@@ -0,0 +1,74 @@
+"""
+================================================================================
+PROJECT: Gravity Framework
+FILE: tests/test_models.py
+PURPOSE: Framework component
+DESCRIPTION: Component of the Gravity Framework for microservices orchestration
+
+AUTHOR: Gravity Framework Team
+EMAIL: team@gravityframework.dev
+LICENSE: MIT
+CREATED: 2025-11-13
+MODIFIED: 2025-11-14
+
+COPYRIGHT: (c) 2025 Gravity Framework Team
+REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
+================================================================================
+"""
+
+import pytest
+from pydantic import ValidationError
+from gravity_framework.models.service import (
+    ServiceManifest,
+    DatabaseType,
+    ServicePort,
+    DatabaseRequirement
+)
+
+
+_BASE_MANIFEST_KW = dict(
+    name="test-service",
+    version="1.0.0",
+    repository="https://github.com/test/test"
+)
+
+
+@pytest.fixture(scope="module")
+def base_manifest():
+    """Validated once; tests derive variants with model_copy(update=...)."""
+    return ServiceManifest(**_BASE_MANIFEST_KW)
+
+
+def test_manifest_copy_recomputes_database_fields(base_manifest):
+    """Test variants made with model_copy report their own db_types/db_env_keys."""
+    assert base_manifest.db_types == frozenset()
+    
+    manifest = base_manifest.model_copy(update={
+        "databases": [DatabaseRequirement(name="main_db", type=DatabaseType.POSTGRESQL)]
+    })
+    
+    assert manifest.db_types == {"postgresql"}
+    assert manifest.db_env_keys == {"main_db": "MAIN_DB_URL"}
+
+
+def test_manifest_database_fields_follow_assignment():
+    """Test db_types/db_env_keys reflect databases reassigned after construction."""
+    manifest = ServiceManifest(
+        databases=[DatabaseRequirement(name="main_db", type=DatabaseType.POSTGRESQL)],
+        **_BASE_MANIFEST_KW
+    )
+    assert manifest.db_types == {"postgresql"}
+    
+    manifest.databases = []
+    
+    assert manifest.db_types == frozenset()
+    assert manifest.db_env_keys == {}
+
+
+def test_port_and_database_requirement_are_frozen():
+    """Test ServicePort and DatabaseRequirement reject assignment after construction."""
+    with pytest.raises(ValidationError):
+        ServicePort(container=8000, host=8000).host = 9000
+    
+    with pytest.raises(ValidationError):
+        DatabaseRequirement(name="main_db", type=DatabaseType.POSTGRESQL).name = "other_db"
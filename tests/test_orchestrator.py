@@ -16,6 +16,20 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import pytest
+from gravity_framework.database.orchestrator import DatabaseOrchestrator
+from tests._fakes import StubPGConn, StubMySQLConn, StubMongoClient, fake_connect, run_sync
+from gravity_framework.models.service import (
+    ServiceManifest,
+    Service,
+    DatabaseType,
+    DatabaseRequirement
+)
+
+
+@pytest.fixture
+def orchestrator():
+    """Create a DatabaseOrchestrator instance."""
     config = {
         "postgres_host": "localhost",
         "postgres_port": 5432,
@@ -29,58 +43,47 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
     return DatabaseOrchestrator(config)
 
 
-@pytest.fixture
-def service_with_postgres():
-    """Create service with PostgreSQL requirement."""
+@pytest.fixture(
+    params=[
+        (DatabaseType.POSTGRESQL, {"extensions": ["uuid-ossp", "pgcrypto"]}),
+        (DatabaseType.MYSQL, {"charset": "utf8mb4", "collation": "utf8mb4_unicode_ci"}),
+        (DatabaseType.MONGODB, {}),
+    ],
+    ids=lambda param: param[0].value
+)
+def db_service(request):
+    """Create service with a single database requirement of each type."""
+    db_type, options = request.param
     manifest = ServiceManifest(
         name="test-service",
         version="1.0.0",
         repository="https://github.com/test/service",
         databases=[
-            DatabaseRequirement(
-                name="test_db",
-                type=DatabaseType.POSTGRESQL,
-                extensions=["uuid-ossp", "pgcrypto"]
-            )
+            DatabaseRequirement(name="test_db", type=db_type, **options)
         ]
     )
     return Service(manifest=manifest)
 
 
-@pytest.fixture
-def service_with_mysql():
-    """Create service with MySQL requirement."""
-    manifest = ServiceManifest(
-        name="test-service",
-        version="1.0.0",
-        repository="https://github.com/test/service",
-        databases=[
-            DatabaseRequirement(
-                name="test_db",
-                type=DatabaseType.MYSQL,
-                charset="utf8mb4",
-                collation="utf8mb4_unicode_ci"
-            )
-        ]
-    )
-    return Service(manifest=manifest)
-
-
-@pytest.fixture
-def service_with_mongodb():
-    """Create service with MongoDB requirement."""
-    manifest = ServiceManifest(
-        name="test-service",
-        version="1.0.0",
-        repository="https://github.com/test/service",
-        databases=[
-            DatabaseRequirement(
-                name="test_db",
-                type=DatabaseType.MONGODB
-            )
-        ]
-    )
-    return Service(manifest=manifest)
+def _patch_driver(monkeypatch, db_type):
+    """Swap in a stub for the client library the orchestrator uses for ``db_type``."""
+    if db_type == DatabaseType.POSTGRESQL:
+        # Server connection, then the new database's for the extensions
+        monkeypatch.setattr(
+            'asyncpg.connect',
+            fake_connect(StubPGConn(), StubPGConn())
+        )
+    elif db_type == DatabaseType.MYSQL:
+        monkeypatch.setattr(
+            'aiomysql.connect',
+            fake_connect(StubMySQLConn())
+        )
+    else:
+        client = StubMongoClient()
+        monkeypatch.setattr(
+            'motor.motor_asyncio.AsyncIOMotorClient',
+            lambda uri: client
+        )
 
 
 class TestDatabaseOrchestrator:
@@ -92,7 +95,6 @@ class TestDatabaseOrchestrator:
         assert orchestrator.postgres_port == 5432
         assert orchestrator.mysql_host == "localhost"
     
-    @pytest.mark.asyncio
     async def test_setup_databases_no_requirements(self, orchestrator):
         """Test setup with no database requirements."""
         manifest = ServiceManifest(
@@ -106,99 +108,26 @@ class TestDatabaseOrchestrator:
         result = await orchestrator.setup_databases(service)
         assert result is True
     
-    @pytest.mark.asyncio
-    @patch('gravity_framework.database.orchestrator.asyncpg.connect')
-    async def test_create_postgres_db(self, mock_connect, orchestrator, service_with_postgres):
-        """Test creating PostgreSQL database."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=None)
-        mock_conn.execute = AsyncMock()
-        mock_conn.close = AsyncMock()
-        mock_connect.return_value = mock_conn
-        
-        result = await orchestrator.setup_databases(service_with_postgres)
-        
-        assert result is True
-        assert "test_db" in service_with_postgres.created_databases
-    
-    @pytest.mark.asyncio
-    @patch('gravity_framework.database.orchestrator.aiomysql.connect')
-    async def test_create_mysql_db(self, mock_connect, orchestrator, service_with_mysql):
-        """Test creating MySQL database."""
-        # Create async mock cursor
-        mock_cursor = AsyncMock()
-        mock_cursor.fetchone = AsyncMock(return_value=None)
-        mock_cursor.execute = AsyncMock()
-        mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
-        mock_cursor.__aexit__ = AsyncMock(return_value=None)
+    async def test_create_database(self, orchestrator, db_service, monkeypatch):
+        """Test creating a database of each supported type."""
+        _patch_driver(monkeypatch, db_service.manifest.databases[0].type)
         
-        # Create async mock connection
-        mock_conn = AsyncMock()
-        mock_conn.cursor = MagicMock(return_value=mock_cursor)
-        mock_conn.commit = AsyncMock()
-        mock_conn.close = MagicMock()  # aiomysql uses sync close
-        
-        # Make connect return the connection
-        async def async_connect(*args, **kwargs):
-            return mock_conn
-        
-        mock_connect.side_effect = async_connect
-        
-        result = await orchestrator.setup_databases(service_with_mysql)
+        result = await orchestrator.setup_databases(db_service)
         
         assert result is True
-        assert "test_db" in service_with_mysql.created_databases
-    
-    @pytest.mark.asyncio
-    async def test_get_connection_string_postgres(self, orchestrator):
-        """Test generating PostgreSQL connection string."""
-        db_req = DatabaseRequirement(
-            name="test_db",
-            type=DatabaseType.POSTGRESQL
-        )
-        
-        conn_str = await orchestrator.get_connection_string(db_req)
-        
-        assert "postgresql+asyncpg://" in conn_str
-        assert "test_user" in conn_str
-        assert "test_db" in conn_str
-    
-    @pytest.mark.asyncio
-    async def test_get_connection_string_mysql(self, orchestrator):
-        """Test generating MySQL connection string."""
-        db_req = DatabaseRequirement(
-            name="test_db",
-            type=DatabaseType.MYSQL,
-            charset="utf8mb4"
-        )
-        
-        conn_str = await orchestrator.get_connection_string(db_req)
-        
-        assert "mysql+aiomysql://" in conn_str
-        assert "test_user" in conn_str
-        assert "charset=utf8mb4" in conn_str
-    
-    @pytest.mark.asyncio
-    async def test_get_connection_string_mongodb(self, orchestrator):
-        """Test generating MongoDB connection string."""
-        db_req = DatabaseRequirement(
-            name="test_db",
-            type=DatabaseType.MONGODB
-        )
-        
-        conn_str = await orchestrator.get_connection_string(db_req)
-        
-        assert "mongodb://" in conn_str
-        assert "test_db" in conn_str
+        assert "test_db" in db_service.created_databases
     
-    @pytest.mark.asyncio
-    async def test_get_connection_string_redis(self, orchestrator):
-        """Test generating Redis connection string."""
-        db_req = DatabaseRequirement(
-            name="cache",
-            type=DatabaseType.REDIS
-        )
-        
-        conn_str = await orchestrator.get_connection_string(db_req)
-        
-        assert "redis://" in conn_str
+    @pytest.mark.parametrize("db_type,options,expected_parts", [
+        (DatabaseType.POSTGRESQL, {}, ["postgresql+asyncpg://", "test_user", "test_db"]),
+        (DatabaseType.MYSQL, {"charset": "utf8mb4"}, ["mysql+aiomysql://", "test_user", "charset=utf8mb4"]),
+        (DatabaseType.MONGODB, {}, ["mongodb://", "test_db"]),
+        (DatabaseType.REDIS, {}, ["redis://"]),
+    ], ids=["pg", "mysql", "mongo", "redis"])
+    def test_get_connection_string(self, orchestrator, db_type, options, expected_parts):
+        """Test generating connection strings for each database type."""
+        db_req = DatabaseRequirement(name="test_db", type=db_type, **options)
+        
+        conn_str = run_sync(orchestrator.get_connection_string(db_req))
+        
+        for part in expected_parts:
+            assert part in conn_str
@@ -16,6 +16,55 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import pytest
+
+from gravity_framework.models.service import Service, ServiceManifest, ServiceDependency
+from gravity_framework.resolver.dependency import DependencyResolver, VersionConstraint
+
+
+# A -> B -> C -> A
+_CIRCULAR_MANIFESTS = (
+    ServiceManifest(
+        name="service-a",
+        version="1.0.0",
+        repository="repo",
+        dependencies=[ServiceDependency(name="service-b")]
+    ),
+    ServiceManifest(
+        name="service-b",
+        version="1.0.0",
+        repository="repo",
+        dependencies=[ServiceDependency(name="service-c")]
+    ),
+    ServiceManifest(
+        name="service-c",
+        version="1.0.0",
+        repository="repo",
+        dependencies=[ServiceDependency(name="service-a")]
+    ),
+)
+
+
+# service-a needs service-b >=2.0.0 but only 1.0.0 is available
+_CONFLICT_MANIFESTS = (
+    ServiceManifest(
+        name="service-a",
+        version="1.0.0",
+        repository="repo",
+        dependencies=[ServiceDependency(name="service-b", version=">=2.0.0")]
+    ),
+    ServiceManifest(
+        name="service-b",
+        version="1.0.0",
+        repository="repo"
+    ),
+)
+
+
+# The resolver only reads services, so one instance of each serves every test
+@pytest.fixture(scope="module")
+def service_a():
+    """Create service A."""
     manifest = ServiceManifest(
         name="service-a",
         version="1.0.0",
@@ -27,7 +76,7 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
     return Service(manifest=manifest)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_b():
     """Create service B."""
     manifest = ServiceManifest(
@@ -41,7 +90,7 @@ def service_b():
     return Service(manifest=manifest)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_c():
     """Create service C."""
     manifest = ServiceManifest(
@@ -53,46 +102,40 @@ def service_c():
     return Service(manifest=manifest)
 
 
+@pytest.fixture(scope="module")
+def built_resolver(service_a, service_b, service_c):
+    """Resolver over services A, B and C with its graph already built."""
+    resolver = DependencyResolver([service_a, service_b, service_c])
+    resolver.build_graph()
+    return resolver
+
+
 class TestVersionConstraint:
     """Test VersionConstraint class."""
     
-    def test_parse_equals(self):
-        """Test parsing == constraint."""
-        constraint = VersionConstraint("==1.0.0")
-        assert constraint.matches("1.0.0")
-        assert not constraint.matches("1.0.1")
-    
-    def test_parse_greater_or_equal(self):
-        """Test parsing >= constraint."""
-        constraint = VersionConstraint(">=1.0.0")
-        assert constraint.matches("1.0.0")
-        assert constraint.matches("1.5.0")
-        assert constraint.matches("2.0.0")
-        assert not constraint.matches("0.9.0")
-    
-    def test_parse_caret(self):
-        """Test parsing ^ constraint (compatible)."""
-        constraint = VersionConstraint("^1.2.3")
-        assert constraint.matches("1.2.3")
-        assert constraint.matches("1.5.0")
-        assert constraint.matches("1.9.9")
-        assert not constraint.matches("2.0.0")
-        assert not constraint.matches("0.9.0")
-    
-    def test_parse_tilde(self):
-        """Test parsing ~ constraint (approximately)."""
-        constraint = VersionConstraint("~1.2.3")
-        assert constraint.matches("1.2.3")
-        assert constraint.matches("1.2.9")
-        assert not constraint.matches("1.3.0")
-        assert not constraint.matches("2.0.0")
-    
-    def test_parse_wildcard(self):
-        """Test parsing * constraint (any version)."""
-        constraint = VersionConstraint("*")
-        assert constraint.matches("0.0.1")
-        assert constraint.matches("1.0.0")
-        assert constraint.matches("99.99.99")
+    @pytest.mark.parametrize("constraint,version,expected", [
+        ("==1.0.0", "1.0.0", True),
+        ("==1.0.0", "1.0.1", False),
+        (">=1.0.0", "1.0.0", True),
+        (">=1.0.0", "1.5.0", True),
+        (">=1.0.0", "2.0.0", True),
+        (">=1.0.0", "0.9.0", False),
+        ("^1.2.3", "1.2.3", True),
+        ("^1.2.3", "1.5.0", True),
+        ("^1.2.3", "1.9.9", True),
+        ("^1.2.3", "2.0.0", False),
+        ("^1.2.3", "0.9.0", False),
+        ("~1.2.3", "1.2.3", True),
+        ("~1.2.3", "1.2.9", True),
+        ("~1.2.3", "1.3.0", False),
+        ("~1.2.3", "2.0.0", False),
+        ("*", "0.0.1", True),
+        ("*", "1.0.0", True),
+        ("*", "99.99.99", True),
+    ])
+    def test_constraint_matches(self, constraint, version, expected):
+        """Test ==, >=, ^ (compatible), ~ (approximately) and * constraints."""
+        assert VersionConstraint(constraint).matches(version) is expected
 
 
 class TestDependencyResolver:
@@ -123,31 +166,7 @@ class TestDependencyResolver:
     
     def test_build_graph_circular_dependency(self):
         """Test detecting circular dependency."""
-        # A -> B -> C -> A
-        manifest_a = ServiceManifest(
-            name="service-a",
-            version="1.0.0",
-            repository="repo",
-            dependencies=[ServiceDependency(name="service-b")]
-        )
-        manifest_b = ServiceManifest(
-            name="service-b",
-            version="1.0.0",
-            repository="repo",
-            dependencies=[ServiceDependency(name="service-c")]
-        )
-        manifest_c = ServiceManifest(
-            name="service-c",
-            version="1.0.0",
-            repository="repo",
-            dependencies=[ServiceDependency(name="service-a")]
-        )
-        
-        services = [
-            Service(manifest=manifest_a),
-            Service(manifest=manifest_b),
-            Service(manifest=manifest_c)
-        ]
+        services = [Service(manifest=m) for m in _CIRCULAR_MANIFESTS]
         
         resolver = DependencyResolver(services)
         result = resolver.build_graph()
@@ -169,46 +188,25 @@ class TestDependencyResolver:
         assert names.index("service-c") < names.index("service-b")
         assert names.index("service-b") < names.index("service-a")
     
-    def test_get_dependencies(self, service_a, service_b, service_c):
+    def test_get_dependencies(self, built_resolver):
         """Test getting direct dependencies."""
-        resolver = DependencyResolver([service_a, service_b, service_c])
-        resolver.build_graph()
-        
-        deps = resolver.get_dependencies("service-a")
+        deps = built_resolver.get_dependencies("service-a")
         assert "service-b" in deps
         
-        deps = resolver.get_dependencies("service-c")
+        deps = built_resolver.get_dependencies("service-c")
         assert len(deps) == 0
     
-    def test_get_dependents(self, service_a, service_b, service_c):
+    def test_get_dependents(self, built_resolver):
         """Test getting services that depend on a service."""
-        resolver = DependencyResolver([service_a, service_b, service_c])
-        resolver.build_graph()
-        
-        dependents = resolver.get_dependents("service-b")
+        dependents = built_resolver.get_dependents("service-b")
         assert "service-a" in dependents
         
-        dependents = resolver.get_dependents("service-a")
+        dependents = built_resolver.get_dependents("service-a")
         assert len(dependents) == 0
     
     def test_version_conflict(self):
         """Test detecting version conflicts."""
-        manifest_a = ServiceManifest(
-            name="service-a",
-            version="1.0.0",
-            repository="repo",
-            dependencies=[ServiceDependency(name="service-b", version=">=2.0.0")]
-        )
-        manifest_b = ServiceManifest(
-            name="service-b",
-            version="1.0.0",  # Lower than required
-            repository="repo"
-        )
-        
-        services = [
-            Service(manifest=manifest_a),
-            Service(manifest=manifest_b)
-        ]
+        services = [Service(manifest=m) for m in _CONFLICT_MANIFESTS]
         
         resolver = DependencyResolver(services)
         result = resolver.build_graph()
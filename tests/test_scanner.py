@@ -16,39 +16,53 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
-    return ServiceScanner(tmp_path / "services")
+import pytest
+import yaml
+from pathlib import Path
 
+from gravity_framework.discovery.scanner import ServiceScanner
+from gravity_framework.models.service import ServiceStatus
 
-@pytest.fixture
-def sample_manifest():
-    """Sample service manifest data."""
-    return {
-        "name": "test-service",
-        "version": "1.0.0",
-        "description": "Test service",
-        "type": "api",
-        "repository": "https://github.com/test/test-service",
-        "branch": "main",
-        "dependencies": [
-            {"name": "user-service", "version": ">=1.0.0"}
-        ],
-        "databases": [
-            {
-                "name": "test_db",
-                "type": "postgresql",
-                "extensions": ["uuid-ossp"]
-            }
-        ],
-        "runtime": "python:3.11",
-        "command": "uvicorn main:app --host 0.0.0.0 --port 8000",
-        "ports": [
-            {"container": 8000, "host": 8001}
-        ],
-        "health_check": {
-            "endpoint": "/health",
-            "interval": 30
+
+# Sample manifest data, serialized once; tests write the YAML text directly
+SAMPLE_MANIFEST = {
+    "name": "test-service",
+    "version": "1.0.0",
+    "description": "Test service",
+    "type": "api",
+    "repository": "https://github.com/test/test-service",
+    "branch": "main",
+    "dependencies": [
+        {"name": "user-service", "version": ">=1.0.0"}
+    ],
+    "databases": [
+        {
+            "name": "test_db",
+            "type": "postgresql",
+            "extensions": ["uuid-ossp"]
         }
+    ],
+    "runtime": "python:3.11",
+    "command": "uvicorn main:app --host 0.0.0.0 --port 8000",
+    "ports": [
+        {"container": 8000, "host": 8001}
+    ],
+    "health_check": {
+        "endpoint": "/health",
+        "interval": 30
     }
+}
+
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_SAMPLE_YAML = yaml.dump(SAMPLE_MANIFEST, Dumper=_DUMPER)
+# Same manifest with a placeholder name, for tests that need several services
+_MANIFEST_TEMPLATE = yaml.dump({**SAMPLE_MANIFEST, "name": "__NAME__"}, Dumper=_DUMPER)
+
+
+@pytest.fixture
+def scanner(tmp_path):
+    """Create a ServiceScanner instance."""
+    return ServiceScanner(tmp_path / "services")
 
 
 class TestServiceScanner:
@@ -59,14 +73,10 @@ class TestServiceScanner:
         assert scanner.services_dir == tmp_path / "services"
         assert scanner.services_dir.exists()
     
-    def test_parse_valid_manifest(self, scanner, sample_manifest, tmp_path):
+    def test_parse_valid_manifest(self, scanner):
         """Test parsing valid manifest."""
-        manifest_path = tmp_path / "gravity-service.yaml"
-        with open(manifest_path, "w") as f:
-            yaml.dump(sample_manifest, f)
-        
-        manifest = scanner._parse_manifest(
-            manifest_path,
+        manifest = scanner._parse_manifest_text(
+            _SAMPLE_YAML,
             "https://github.com/test/test-service",
             "main"
         )
@@ -77,35 +87,27 @@ class TestServiceScanner:
         assert len(manifest.databases) == 1
         assert len(manifest.dependencies) == 1
     
-    def test_parse_invalid_yaml(self, scanner, tmp_path):
+    def test_parse_invalid_yaml(self, scanner):
         """Test parsing invalid YAML."""
-        manifest_path = tmp_path / "gravity-service.yaml"
-        manifest_path.write_text("invalid: yaml: content: {")
-        
-        manifest = scanner._parse_manifest(manifest_path, "repo", "main")
+        manifest = scanner._parse_manifest_text("invalid: yaml: content: {", "repo", "main")
         assert manifest is None
     
-    def test_parse_empty_manifest(self, scanner, tmp_path):
+    def test_parse_empty_manifest(self, scanner):
         """Test parsing empty manifest."""
-        manifest_path = tmp_path / "gravity-service.yaml"
-        manifest_path.write_text("")
-        
-        manifest = scanner._parse_manifest(manifest_path, "repo", "main")
+        manifest = scanner._parse_manifest_text("", "repo", "main")
+        assert manifest is None
+    
+    def test_parse_missing_manifest_file(self, scanner, tmp_path):
+        """Test parsing a manifest path that cannot be read."""
+        manifest = scanner._parse_manifest(tmp_path / "missing.yaml", "repo", "main")
         assert manifest is None
     
-    @patch('gravity_framework.discovery.scanner.git.Repo')
-    def test_discover_from_git(self, mock_repo_class, scanner, sample_manifest, tmp_path):
+    def test_discover_from_git(self, mock_git, scanner, tmp_path):
         """Test discovering service from Git repository."""
-        # Setup mock
-        mock_repo = MagicMock()
-        mock_repo_class.clone_from.return_value = mock_repo
-        
         # Create manifest file
         service_path = scanner.services_dir / "test-service"
         service_path.mkdir(parents=True)
-        manifest_path = service_path / "gravity-service.yaml"
-        with open(manifest_path, "w") as f:
-            yaml.dump(sample_manifest, f)
+        (service_path / "gravity-service.yaml").write_text(_SAMPLE_YAML)
         
         # Test discovery
         service = scanner.discover_from_git("https://github.com/test/test-service")
@@ -114,22 +116,16 @@ class TestServiceScanner:
         assert service.manifest.name == "test-service"
         assert service.status == ServiceStatus.DISCOVERED
     
-    @patch('gravity_framework.discovery.scanner.git.Repo')
-    def test_discover_from_git_no_manifest(self, mock_repo_class, scanner):
+    def test_discover_from_git_no_manifest(self, mock_git, scanner):
         """Test discovering service without manifest."""
-        mock_repo = MagicMock()
-        mock_repo_class.clone_from.return_value = mock_repo
-        
         service = scanner.discover_from_git("https://github.com/test/no-manifest")
         assert service is None
     
-    def test_discover_from_path(self, scanner, sample_manifest, tmp_path):
+    def test_discover_from_path(self, scanner, tmp_path):
         """Test discovering service from local path."""
         service_path = tmp_path / "local-service"
         service_path.mkdir()
-        manifest_path = service_path / "gravity-service.yaml"
-        with open(manifest_path, "w") as f:
-            yaml.dump(sample_manifest, f)
+        (service_path / "gravity-service.yaml").write_text(_SAMPLE_YAML)
         
         service = scanner.discover_from_path(service_path)
         
@@ -137,17 +133,18 @@ class TestServiceScanner:
         assert service.manifest.name == "test-service"
         assert service.status == ServiceStatus.DISCOVERED
     
-    def test_discover_all(self, scanner, sample_manifest):
+    def test_discover_all(self, fs):
         """Test discovering all services in directory."""
+        # pyfakefs keeps the whole tree in memory
+        scanner = ServiceScanner(Path("/services"))
+        
         # Create multiple services
         for i in range(3):
             service_path = scanner.services_dir / f"service-{i}"
             service_path.mkdir()
-            manifest_data = sample_manifest.copy()
-            manifest_data["name"] = f"service-{i}"
-            manifest_path = service_path / "gravity-service.yaml"
-            with open(manifest_path, "w") as f:
-                yaml.dump(manifest_data, f)
+            (service_path / "gravity-service.yaml").write_text(
+                _MANIFEST_TEMPLATE.replace("__NAME__", f"service-{i}")
+            )
         
         services = scanner.discover_all()
         
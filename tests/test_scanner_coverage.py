@@ -16,111 +16,108 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 ================================================================================
 """
 
+import os
 import pytest
 import yaml
 import git
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
 from gravity_framework.discovery.scanner import ServiceScanner
 
 
-@pytest.fixture
-def temp_services_dir(tmp_path):
-    """Create a temporary services directory."""
-    services_dir = tmp_path / "services"
-    return services_dir
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
+# Manifests written by the tests, serialized and encoded once at import
+_ALT_MANIFEST = yaml.dump(
+    {"name": "alt-service", "version": "1.0.0", "repository": "https://github.com/test/alt-service", "type": "api"},
+    Dumper=_DUMPER
+).encode("ascii")
+_HIDDEN_MANIFEST = yaml.dump(
+    {"name": "hidden-service", "version": "1.0.0", "repository": "https://github.com/test/hidden"},
+    Dumper=_DUMPER
+).encode("ascii")
+_NORMAL_MANIFEST = yaml.dump(
+    {"name": "normal-service", "version": "1.0.0", "repository": "https://github.com/test/normal"},
+    Dumper=_DUMPER
+).encode("ascii")
+_EXISTING_MANIFEST = yaml.dump(
+    {"name": "existing-service", "version": "2.0.0", "repository": "https://github.com/test/existing-service"},
+    Dumper=_DUMPER
+).encode("ascii")
 
-@pytest.fixture
+
+def _make_service_dir(scanner, slug):
+    """Create ``scanner.services_dir / slug``; the scanner already made its parent."""
+    service_path = scanner.services_dir / slug
+    os.mkdir(service_path)
+    return service_path
+
+
+@pytest.fixture(scope="module")
+def temp_services_dir(tmp_path_factory):
+    """Create a temporary services directory shared by the module."""
+    return tmp_path_factory.mktemp("services_root") / "services"
+
+
+@pytest.fixture(scope="module")
 def scanner(temp_services_dir):
-    """Create a ServiceScanner instance."""
+    """Create a ServiceScanner shared by the module.
+    
+    Tests write into their own ``services_dir / <slug>`` checkouts.
+    """
     return ServiceScanner(temp_services_dir)
 
 
-def test_scanner_creates_services_dir(temp_services_dir):
+@pytest.fixture
+def fresh_scanner(tmp_path):
+    """Create a ServiceScanner over an empty directory, for discover_all tests."""
+    return ServiceScanner(tmp_path / "services")
+
+
+def test_scanner_creates_services_dir(tmp_path):
     """Test that scanner creates services directory if it doesn't exist."""
+    temp_services_dir = tmp_path / "services"
     assert not temp_services_dir.exists()
     scanner = ServiceScanner(temp_services_dir)
     assert temp_services_dir.exists()
     assert scanner.services_dir == temp_services_dir
 
 
-def test_discover_from_git_invalid_manifest(scanner, tmp_path):
-    """Test discovering service with invalid manifest file."""
-    repo_url = "https://github.com/test/invalid-service"
-    
-    mock_repo = MagicMock()
-    service_path = scanner.services_dir / "invalid-service"
-    service_path.mkdir(parents=True, exist_ok=True)
-    
-    # Create invalid YAML
-    manifest_path = service_path / "gravity-service.yaml"
-    manifest_path.write_text("invalid: yaml: content: ::::")
-    
-    with patch("gravity_framework.discovery.scanner.git.Repo.clone_from", return_value=mock_repo):
-        service = scanner.discover_from_git(repo_url)
-        assert service is None
-
-
-def test_discover_from_git_empty_manifest(scanner, tmp_path):
-    """Test discovering service with empty manifest file."""
-    repo_url = "https://github.com/test/empty-service"
-    
-    mock_repo = MagicMock()
-    service_path = scanner.services_dir / "empty-service"
-    service_path.mkdir(parents=True, exist_ok=True)
-    
-    # Create empty manifest
-    manifest_path = service_path / "gravity-service.yaml"
-    manifest_path.write_text("")
-    
-    with patch("gravity_framework.discovery.scanner.git.Repo.clone_from", return_value=mock_repo):
-        service = scanner.discover_from_git(repo_url)
-        assert service is None
-
-
-def test_discover_from_git_validation_error(scanner, tmp_path):
-    """Test discovering service with manifest validation error."""
-    repo_url = "https://github.com/test/validation-error-service"
-    
-    mock_repo = MagicMock()
-    service_path = scanner.services_dir / "validation-error-service"
-    service_path.mkdir(parents=True, exist_ok=True)
-    
-    # Create manifest missing required fields
-    manifest_path = service_path / "gravity-service.yaml"
-    manifest_path.write_text("""
-name: test
-# missing version and repository
-""")
-    
-    with patch("gravity_framework.discovery.scanner.git.Repo.clone_from", return_value=mock_repo):
-        service = scanner.discover_from_git(repo_url)
-        assert service is None
+@pytest.fixture
+def cloned_service(scanner, request):
+    """Checkout for ``request.param = (slug, manifest_text)``; returns the slug."""
+    slug, manifest_text = request.param
+    service_path = _make_service_dir(scanner, slug)
+    (service_path / "gravity-service.yaml").write_text(manifest_text)
+    return slug
+
+
+@pytest.mark.parametrize("cloned_service", [
+    ("invalid-service", "invalid: yaml: content: ::::"),
+    ("empty-service", ""),
+    # Missing version and repository
+    ("validation-error-service", "name: test\n"),
+], ids=["invalid-yaml", "empty", "validation-error"], indirect=True)
+def test_discover_from_git_bad_manifest(scanner, cloned_service, mock_git):
+    """Test discovering service whose manifest is unparseable, empty or invalid."""
+    service = scanner.discover_from_git(f"https://github.com/test/{cloned_service}")
+    assert service is None
 
 
-def test_discover_from_git_alternative_manifest_names(scanner, tmp_path):
+def test_discover_from_git_alternative_manifest_names(scanner, mock_git):
     """Test discovering service with alternative manifest file names."""
     repo_url = "https://github.com/test/alt-service"
     
-    mock_repo = MagicMock()
-    service_path = scanner.services_dir / "alt-service"
-    service_path.mkdir(parents=True, exist_ok=True)
+    service_path = _make_service_dir(scanner, "alt-service")
     
     # Create manifest with alternative name
     manifest_path = service_path / "gravity-service.yml"
-    manifest_data = {
-        "name": "alt-service",
-        "version": "1.0.0",
-        "repository": repo_url,
-        "type": "api"
-    }
-    manifest_path.write_text(yaml.dump(manifest_data))
-    
-    with patch("gravity_framework.discovery.scanner.git.Repo.clone_from", return_value=mock_repo):
-        service = scanner.discover_from_git(repo_url)
-        assert service is not None
-        assert service.manifest.name == "alt-service"
+    manifest_path.write_bytes(_ALT_MANIFEST)
+    
+    service = scanner.discover_from_git(repo_url)
+    assert service is not None
+    assert service.manifest.name == "alt-service"
 
 
 def test_discover_from_git_git_error(scanner):
@@ -162,73 +159,88 @@ def test_discover_from_path_invalid_manifest(scanner, tmp_path):
     assert service is None
 
 
-def test_discover_all_with_hidden_dirs(scanner, tmp_path):
+def test_discover_all_with_hidden_dirs(fresh_scanner):
     """Test discover_all skips hidden directories."""
     # Create hidden directory
-    hidden_dir = scanner.services_dir / ".hidden"
-    hidden_dir.mkdir(parents=True)
+    hidden_dir = _make_service_dir(fresh_scanner, ".hidden")
     manifest_path = hidden_dir / "gravity-service.yaml"
-    manifest_data = {
-        "name": "hidden-service",
-        "version": "1.0.0",
-        "repository": "https://github.com/test/hidden"
-    }
-    manifest_path.write_text(yaml.dump(manifest_data))
+    manifest_path.write_bytes(_HIDDEN_MANIFEST)
     
     # Create normal directory
-    normal_dir = scanner.services_dir / "normal"
-    normal_dir.mkdir()
+    normal_dir = _make_service_dir(fresh_scanner, "normal")
     manifest_path = normal_dir / "gravity-service.yaml"
-    manifest_data = {
-        "name": "normal-service",
-        "version": "1.0.0",
-        "repository": "https://github.com/test/normal"
-    }
-    manifest_path.write_text(yaml.dump(manifest_data))
-    
-    services = scanner.discover_all()
+    manifest_path.write_bytes(_NORMAL_MANIFEST)
+    
+    # A deep hidden tree, like a stray .git checkout
+    objects_dir = hidden_dir / ".git" / "objects" / "ab"
+    objects_dir.mkdir(parents=True)
+    for i in range(5):
+        (objects_dir / f"object-{i}").write_bytes(b"\0")
+    
+    with patch("os.stat", wraps=os.stat) as mock_stat:
+        services = fresh_scanner.discover_all()
+    
     assert len(services) == 1
     assert services[0].manifest.name == "normal-service"
+    # The hidden subtree is never stat'd
+    assert not any(".hidden" in str(call.args[0]) for call in mock_stat.call_args_list)
 
 
-def test_discover_all_with_files(scanner, tmp_path):
+def test_discover_all_with_files(fresh_scanner):
     """Test discover_all skips files in services directory."""
     # Create a file instead of directory
-    file_path = scanner.services_dir / "not-a-dir.txt"
-    scanner.services_dir.mkdir(parents=True, exist_ok=True)
+    file_path = fresh_scanner.services_dir / "not-a-dir.txt"
     file_path.write_text("just a file")
     
-    services = scanner.discover_all()
+    services = fresh_scanner.discover_all()
     assert len(services) == 0
 
 
-def test_discover_from_git_update_existing_repo(scanner, tmp_path):
+def test_discover_all_follows_symlinked_service_dirs(fresh_scanner, tmp_path):
+    """Test discover_all finds a local checkout linked into the services directory."""
+    checkout = tmp_path / "real" / "normal"
+    checkout.mkdir(parents=True)
+    (checkout / "gravity-service.yaml").write_bytes(_NORMAL_MANIFEST)
+    
+    (fresh_scanner.services_dir / "normal").symlink_to(checkout, target_is_directory=True)
+    
+    services = fresh_scanner.discover_all()
+    assert [s.manifest.name for s in services] == ["normal-service"]
+
+
+def test_discover_all_follows_symlinked_manifests(fresh_scanner, tmp_path):
+    """Test discover_all reads a manifest file linked into a service directory."""
+    shared = tmp_path / "shared.yaml"
+    shared.write_bytes(_NORMAL_MANIFEST)
+    
+    service_path = _make_service_dir(fresh_scanner, "normal")
+    (service_path / "gravity-service.yaml").symlink_to(shared)
+    
+    services = fresh_scanner.discover_all()
+    assert [s.manifest.name for s in services] == ["normal-service"]
+
+
+def test_discover_from_git_update_existing_repo(scanner, monkeypatch):
     """Test discovering service updates existing repository."""
     repo_url = "https://github.com/test/existing-service"
     
     # Create existing service directory
-    service_path = scanner.services_dir / "existing-service"
-    service_path.mkdir(parents=True)
+    service_path = _make_service_dir(scanner, "existing-service")
     
-    # Mock git.Repo for existing repository
-    mock_repo = MagicMock()
-    mock_origin = MagicMock()
-    mock_origin.pull = MagicMock()
-    mock_repo.remotes.origin = mock_origin
+    # Mock git.Repo for existing repository; spec catches misspelled Repo/Remote calls
+    mock_repo = Mock(spec=git.Repo)
+    mock_origin = Mock(spec=git.Remote)
+    mock_repo.remotes = Mock(origin=mock_origin)
+    mock_repo.git.custom_environment.return_value = nullcontext()
     
     # Create valid manifest
     manifest_path = service_path / "gravity-service.yaml"
-    manifest_data = {
-        "name": "existing-service",
-        "version": "2.0.0",
-        "repository": repo_url
-    }
-    manifest_path.write_text(yaml.dump(manifest_data))
-    
-    with patch("gravity_framework.discovery.scanner.git.Repo", return_value=mock_repo):
-        service = scanner.discover_from_git(repo_url, "develop")
-        
-        assert service is not None
-        assert service.manifest.name == "existing-service"
-        assert service.manifest.version == "2.0.0"
-        mock_origin.pull.assert_called_once_with("develop")
+    manifest_path.write_bytes(_EXISTING_MANIFEST)
+    
+    monkeypatch.setattr("gravity_framework.discovery.scanner.git.Repo", Mock(return_value=mock_repo))
+    service = scanner.discover_from_git(repo_url, "develop")
+    
+    assert service is not None
+    assert service.manifest.name == "existing-service"
+    assert service.manifest.version == "2.0.0"
+    mock_origin.pull.assert_called_once_with("develop")
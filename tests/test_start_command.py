@@ -17,19 +17,21 @@ REPOSITORY: https://github.com/GravtyWaves/GravityFrameWork
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from click.testing import CliRunner
+import subprocess
+from unittest.mock import AsyncMock, Mock, patch
+from typer.testing import CliRunner
 from gravity_framework.cli.main import app
 from gravity_framework.models.service import Service, ServiceManifest, ServicePort
+from tests._fakes import FakeRun
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Create CLI runner."""
+    """Create CLI runner (invoke keeps no state on the runner)."""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service():
     """Create a sample service."""
     manifest = ServiceManifest(
@@ -42,55 +44,48 @@ def sample_service():
     return Service(manifest=manifest)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_framework(sample_service):
-    """Mock GravityFramework."""
+    """Mock GravityFramework, patched once for the whole module."""
     with patch('gravity_framework.cli.main.get_framework') as mock:
         framework = Mock()
-        
-        # Mock get_all_services to return sample service
-        async def mock_get_all():
-            return [sample_service]
-        
-        framework.get_all_services = mock_get_all
+        framework.get_all_services = AsyncMock(return_value=[sample_service])
         mock.return_value = framework
         
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def _patch_cwd(monkeypatch, tmp_path):
+    """Point the CLI's working directory at the test's tmp_path."""
+    monkeypatch.setattr("gravity_framework.cli.main.Path.cwd", lambda: tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
-def mock_docker_compose():
-    """Mock subprocess for docker-compose."""
-    with patch('subprocess.run') as mock:
-        result = Mock()
-        result.returncode = 0
-        result.stdout = "Services started"
-        result.stderr = ""
-        mock.return_value = result
-        yield mock
+def fake_run(monkeypatch):
+    """Replace subprocess.run with a recorder that reports a successful docker-compose run."""
+    run = FakeRun(stdout="Services started")
+    monkeypatch.setattr(subprocess, "run", run)
+    return run
 
 
 def test_start_command_help(cli_runner):
     """Test start command help."""
-    result = cli_runner.invoke(app, ["start", "--help"])
+    result = cli_runner.invoke(app, ["start", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
     assert "Generate docker-compose.yml and start services" in result.stdout
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
 def test_start_generates_compose_file(
-    mock_cwd,
     cli_runner,
     mock_framework,
-    mock_docker_compose,
+    fake_run,
     tmp_path
 ):
     """Test that start command generates docker-compose.yml."""
-    # Setup temp directory
-    mock_cwd.return_value = tmp_path
-    
     # Run command
-    result = cli_runner.invoke(app, ["start"])
+    result = cli_runner.invoke(app, ["start"], catch_exceptions=False)
     
     # Check docker-compose.yml was created
     compose_file = tmp_path / "docker-compose.yml"
@@ -103,18 +98,14 @@ def test_start_generates_compose_file(
     assert "test-service:" in content
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
 def test_start_generates_env_example(
-    mock_cwd,
     cli_runner,
     mock_framework,
-    mock_docker_compose,
+    fake_run,
     tmp_path
 ):
     """Test that start command generates .env.example."""
-    mock_cwd.return_value = tmp_path
-    
-    result = cli_runner.invoke(app, ["start"])
+    result = cli_runner.invoke(app, ["start"], catch_exceptions=False)
     
     # Check .env.example was created
     env_file = tmp_path / ".env.example"
@@ -125,131 +116,81 @@ def test_start_generates_env_example(
     assert "POSTGRES" in content or "Gravity Framework" in content
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
 def test_start_calls_docker_compose(
-    mock_cwd,
     cli_runner,
     mock_framework,
-    mock_docker_compose,
-    tmp_path
+    fake_run
 ):
     """Test that start command calls docker-compose up."""
-    mock_cwd.return_value = tmp_path
-    
-    result = cli_runner.invoke(app, ["start"])
+    result = cli_runner.invoke(app, ["start"], catch_exceptions=False)
     
     # Check docker-compose was called
-    mock_docker_compose.assert_called_once()
+    assert len(fake_run.calls) == 1
     
     # Check command arguments
-    call_args = mock_docker_compose.call_args
-    cmd = call_args[0][0]
+    cmd = fake_run.calls[-1]
     assert "docker-compose" in cmd
     assert "up" in cmd
     assert "-d" in cmd  # detached by default
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
 def test_start_with_build_flag(
-    mock_cwd,
     cli_runner,
     mock_framework,
-    mock_docker_compose,
-    tmp_path
+    fake_run
 ):
     """Test start command with --build flag."""
-    mock_cwd.return_value = tmp_path
-    
-    result = cli_runner.invoke(app, ["start", "--build"])
+    result = cli_runner.invoke(app, ["start", "--build"], catch_exceptions=False)
     
     # Check --build was passed to docker-compose
-    call_args = mock_docker_compose.call_args
-    cmd = call_args[0][0]
+    cmd = fake_run.calls[-1]
     assert "--build" in cmd
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
 def test_start_no_detach(
-    mock_cwd,
     cli_runner,
     mock_framework,
-    mock_docker_compose,
-    tmp_path
+    fake_run
 ):
     """Test start command without detached mode."""
-    mock_cwd.return_value = tmp_path
-    
-    result = cli_runner.invoke(app, ["start", "--no-detach"])
+    result = cli_runner.invoke(app, ["start", "--no-detach"], catch_exceptions=False)
     
     # Check -d was NOT passed
-    call_args = mock_docker_compose.call_args
-    cmd = call_args[0][0]
+    cmd = fake_run.calls[-1]
     assert "-d" not in cmd
 
 
-@patch('gravity_framework.cli.main.Path.cwd')
-def test_start_with_no_services(
-    mock_cwd,
-    cli_runner,
-    tmp_path
-):
-    """Test start command when no services found."""
-    mock_cwd.return_value = tmp_path
-    
-    with patch('gravity_framework.cli.main.get_framework') as mock:
+def _setup_scenario(monkeypatch, fake_run, scenario):
+    """Install the failure mode for a start-command error scenario."""
+    if scenario == "no_services":
         framework = Mock()
-        
-        async def mock_get_all():
-            return []
-        
-        framework.get_all_services = mock_get_all
-        mock.return_value = framework
-        
-        result = cli_runner.invoke(app, ["start"])
-        
-        # Should exit with error
-        assert result.exit_code == 1
-        assert "No services found" in result.stdout
-
-
-@patch('gravity_framework.cli.main.Path.cwd')
-def test_start_docker_compose_failure(
-    mock_cwd,
+        framework.get_all_services = AsyncMock(return_value=[])
+        monkeypatch.setattr('gravity_framework.cli.main.get_framework', lambda *args, **kwargs: framework)
+    elif scenario == "compose_fail":
+        fake_run.returncode = 1
+        fake_run.stderr = "Error: containers failed to start"
+    elif scenario == "no_docker":
+        fake_run.error = FileNotFoundError()
+
+
+@pytest.mark.parametrize("scenario,expected_msg", [
+    ("no_services", "No services found"),
+    ("compose_fail", "Failed to start services"),
+    ("no_docker", "docker-compose not found"),
+])
+def test_start_errors(
     cli_runner,
     mock_framework,
-    tmp_path
+    fake_run,
+    monkeypatch,
+    scenario,
+    expected_msg
 ):
-    """Test start command when docker-compose fails."""
-    mock_cwd.return_value = tmp_path
+    """Test start command exits with an error message for each failure mode."""
+    _setup_scenario(monkeypatch, fake_run, scenario)
     
-    with patch('subprocess.run') as mock_run:
-        result = Mock()
-        result.returncode = 1
-        result.stderr = "Error: containers failed to start"
-        mock_run.return_value = result
-        
-        result = cli_runner.invoke(app, ["start"])
-        
-        # Should exit with error
-        assert result.exit_code == 1
-        assert "Failed to start services" in result.stdout
-
-
-@patch('gravity_framework.cli.main.Path.cwd')
-def test_start_docker_not_installed(
-    mock_cwd,
-    cli_runner,
-    mock_framework,
-    tmp_path
-):
-    """Test start command when docker-compose not installed."""
-    mock_cwd.return_value = tmp_path
+    result = cli_runner.invoke(app, ["start"], catch_exceptions=False)
     
-    with patch('subprocess.run') as mock_run:
-        mock_run.side_effect = FileNotFoundError()
-        
-        result = cli_runner.invoke(app, ["start"])
-        
-        # Should exit with error
-        assert result.exit_code == 1
-        assert "docker-compose not found" in result.stdout
+    # Should exit with error
+    assert result.exit_code == 1
+    assert expected_msg in result.stdout